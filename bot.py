@@ -12,6 +12,8 @@ from config import Config
 from command_handler import register_command_handlers
 from helfer.markdown_helfer import escape_md_v2
 from handlers.message_handler import handle_message
+from utils import close_thumb_session
+from metadata import close_cover_session
 from html import escape as html_escape
 
 # Logging-Verzeichnis erstellen
@@ -126,6 +128,10 @@ async def run_bot():
 
             await application.shutdown()
 
+        # Gemeinsame HTTP-Sessions schließen (werden bei Bedarf lazy angelegt)
+        await close_thumb_session()
+        await close_cover_session()
+
         logger.info("=" * 50 + "\n")
 
 
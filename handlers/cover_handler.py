@@ -1,4 +1,5 @@
 import asyncio
+import aiohttp
 from pathlib import Path
 from telegram import Update
 from telegram.ext import ContextTypes
@@ -15,6 +16,7 @@ from klassen.clean_artist import CleanArtist
 from klassen.title_cleaner import TitleCleaner
 from klassen.youtube_client import YouTubeClient
 from klassen.artist_map import ARTIST_RULES, ARTIST_OVERRIDES
+from services.organizer import iter_audio_files
 
 async def handle_fixcovers(update: Update, context: ContextTypes.DEFAULT_TYPE):
     reply_target = update.callback_query.message if update.callback_query else update.message
@@ -24,17 +26,20 @@ async def handle_fixcovers(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     msg = await reply_target.reply_text("🔍 Suche nach Audiodateien in der Bibliothek...")
 
+    session = None
     try:
         # Clients initialisieren
         artist_cleaner = CleanArtist()  # Keine Parameter nötig!
         musicbrainz_client = MusicBrainzClient(artist_cleaner)
         genius_client = GeniusClient(artist_cleaner)
         lastfm_client = LastFMClient()
-        youtube_client = YouTubeClient()
-        cover_fixer = CoverFixer(musicbrainz_client, genius_client, lastfm_client, debug=True)
+        # Eine gemeinsame HTTP-Session für alle Cover- und Thumbnail-Downloads
+        session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300))
+        youtube_client = YouTubeClient(session=session)
+        cover_fixer = CoverFixer(musicbrainz_client, genius_client, lastfm_client, debug=True, session=session)
 
         library_path = Path(Config.LIBRARY_DIR)
-        audio_files = list(library_path.rglob("*.m4a"))
+        audio_files = [Path(entry.path) for entry in iter_audio_files(library_path, (".m4a",))]
         total_files = len(audio_files)
 
         if total_files == 0:
@@ -125,4 +130,7 @@ async def handle_fixcovers(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     except Exception as e:
         log_error(f"Ein schwerwiegender Fehler in handle_fixcovers: {e}", "cover_handler")
-        await msg.edit_text(f"❌ **Fehler:**\n`{e}`")
\ No newline at end of file
+        await msg.edit_text(f"❌ **Fehler:**\n`{e}`")
+    finally:
+        if session is not None:
+            await session.close()
@@ -6,6 +6,7 @@ from telegram.ext import ContextTypes
 from pathlib import Path
 
 from services.downloader import YoutubeDownloader
+from services.status_service import mark_user_active, mark_user_inactive
 from logger import log_info, log_error, log_warning, log_debug
 
 YOUTUBE_REGEX = r"(https?://)?(www\.)?(youtube\.com|youtu\.be)/[^\s]+"
@@ -38,6 +39,7 @@ async def process_audio_download(url: str, update: Update, user_id: int) -> None
     status_msg = await update.message.reply_text("Starting download...")
 
     downloader = YoutubeDownloader(update)
+    mark_user_active()
     try:
         processed_result = await downloader.download_audio(url)
         if processed_result:
@@ -49,6 +51,9 @@ async def process_audio_download(url: str, update: Update, user_id: int) -> None
         error_message = f"❌ Unexpected error: {str(e)}"
         log_error(f"Unexpected error in process_audio_download: {str(e)}", context="message_handler", exc_info=True)
         await handle_download_failure(update, status_msg, error_message)
+    finally:
+        await downloader.close()
+        mark_user_inactive()
 
 def process_download_result(result: Union[Dict[str, Any], str, None]) -> Dict[str, Any]:
     """Process download result and return standardized dictionary"""
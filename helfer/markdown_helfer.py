@@ -1,5 +1,9 @@
 # yt_music_bot/utils/markdown_helfer.py
 
+# Enthält auch den Backslash selbst. str.translate ersetzt alle Zeichen in einem
+# Durchlauf, daher spielt die Reihenfolge (anders als bei replace-Ketten) keine Rolle.
+_MD_V2_TABLE = str.maketrans({c: '\\' + c for c in '\\_*[]()~`>#+-=|{}.!'})
+
 def escape_md_v2(text: str) -> str:
     """
     Escaped einen Text gemäß Telegram MarkdownV2-Spezifikation.
@@ -11,18 +15,4 @@ def escape_md_v2(text: str) -> str:
     if not isinstance(text, str):
         text = str(text)
 
-    # Das Backslash-Zeichen muss zuerst escapet werden,
-    # da es selbst als Escape-Zeichen für die anderen Sonderzeichen dient.
-    # Andernfalls würde ein vorhandener Backslash im Originaltext falsch interpretiert.
-    text = text.replace('\\', '\\\\')
-
-    reserved_chars = [
-        '_', '*', '[', ']', '(', ')', '~', '`',
-        '>', '#', '+', '-', '=', '|', '{', '}',
-        '.', '!'
-    ]
-
-    for char in reserved_chars:
-        text = text.replace(char, f'\\{char}')
-
-    return text
\ No newline at end of file
+    return text.translate(_MD_V2_TABLE)
\ No newline at end of file
@@ -1,22 +1,44 @@
 # klassen/clean_artist.py
 
 import re
+from functools import lru_cache
 from logger import log_debug
 from klassen.artist_map import ARTIST_RULES, ARTIST_OVERRIDES
 
+
+def _compile_rules(rules):
+    """Kompiliert (pattern, replacement)-Paare einmalig; akzeptiert Liste oder Dict."""
+    if hasattr(rules, "items"):
+        rules = rules.items()
+    return [(re.compile(pattern, re.IGNORECASE), replacement) for pattern, replacement in rules]
+
+
+# Standardregeln werden beim Import einmalig kompiliert
+_COMPILED_ARTIST_RULES = _compile_rules(ARTIST_RULES)
+
+
 class CleanArtist:
-    def __init__(self):
-        self.rules = ARTIST_RULES
-        self.overrides = ARTIST_OVERRIDES
+    def __init__(self, artist_rules=None, artist_overrides=None, cache_size: int = 8192):
+        self.rules = _COMPILED_ARTIST_RULES if artist_rules is None else _compile_rules(artist_rules)
+        self.overrides = ARTIST_OVERRIDES if artist_overrides is None else {
+            k.lower(): v for k, v in artist_overrides.items()
+        }
+        # Regeln und Overrides sind nach __init__ unveränderlich -> Ergebnisse pro Instanz cachen.
+        # cache_size an die Anzahl unterschiedlicher Künstler in der Bibliothek anpassen.
+        self._clean_cached = lru_cache(maxsize=cache_size)(self._clean)
 
     def clean(self, name: str) -> str:
+        """Bereinigt einen Künstlernamen; wiederholte Namen kommen aus dem Cache."""
+        return self._clean_cached(name)
+
+    def _clean(self, name: str) -> str:
         """Bereinigt und normalisiert einen K¨¹nstlernamen anhand definierter Regeln und Overrides."""
         original = name
         name = name.strip().lower()
 
         # Regex-Regeln anwenden
-        for pattern, replacement in self.rules.items():
-            name = re.sub(pattern, replacement, name, flags=re.IGNORECASE)
+        for pattern, replacement in self.rules:
+            name = pattern.sub(replacement, name)
 
         # Overrides anwenden
         if name in self.overrides:
@@ -1,7 +1,7 @@
 import asyncio
 import aiohttp
 import io
-from typing import Optional
+from typing import Iterable, List, Optional, Tuple
 from cachetools import TTLCache
 from PIL import Image
 from logger import log_error, log_info, log_debug, log_warning
@@ -14,17 +14,48 @@ class CoverFixer:
 
     _cover_cache = TTLCache(maxsize=200, ttl=3600)  # 1 Stunde Cache
 
-    def __init__(self, musicbrainz_client, genius_client, lastfm_client, debug: bool = False):
+    def __init__(self, musicbrainz_client, genius_client, lastfm_client, debug: bool = False,
+                 session: Optional[aiohttp.ClientSession] = None):
         self.musicbrainz_client = musicbrainz_client
         self.genius_client = genius_client
         self.lastfm_client = lastfm_client
         self.debug = debug
 
+        # Gemeinsame HTTP-Session (Keep-Alive + Connection-Pool) für alle Downloads.
+        # Wird keine Session übergeben, wird sie beim ersten Download erzeugt und gehört dieser Instanz.
+        self._session = session
+        self._owns_session = session is None
+
         self.supported_formats = ['image/jpeg', 'image/png']
         self.max_size = Config.MAX_COVER_SIZE
         self.min_resolution = (300, 300)
         self.max_resolution = (1000, 1000)
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._owns_session = True
+        return self._session
+
+    async def close(self) -> None:
+        """Schließt die HTTP-Session, sofern sie von dieser Instanz erzeugt wurde."""
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def fetch_covers(self, items: Iterable[Tuple[str, str, Optional[str]]]) -> List[Optional[bytes]]:
+        """Sucht Cover für mehrere (title, artist, album)-Tupel parallel über dieselbe Session."""
+        return await asyncio.gather(
+            *(self.fetch_cover(title, artist, album) for title, artist, album in items)
+        )
+
     async def fetch_cover(self, title: str, artist: str, album: str = None) -> Optional[bytes]:
         """
         Sucht nach einem Cover, validiert es, speichert es im Cache und gibt die Bilddaten zurück.
@@ -106,19 +137,19 @@ class CoverFixer:
             log_debug(f"📥 Lade Cover von: {url}", "CoverFixer")
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=Config.COVER_DOWNLOAD_TIMEOUT) as response:
-                    response.raise_for_status()
-                    content = await response.read()
-
-                    if self.debug:
-                        log_debug(f"⬇️ Geladene Größe: {len(content)} Bytes", "CoverFixer")
-
-                    if len(content) <= self.max_size:
-                        return content
-                    log_warning(f"⚠️ Cover zu groß: {len(content)} Bytes. Wird zur Validierung weitergeleitet.", "CoverFixer")
-                    # Wir erlauben hier größere Dateien, da die Validierung sie skaliert
+            session = self._get_session()
+            async with session.get(url, timeout=Config.COVER_DOWNLOAD_TIMEOUT) as response:
+                response.raise_for_status()
+                content = await response.read()
+
+                if self.debug:
+                    log_debug(f"⬇️ Geladene Größe: {len(content)} Bytes", "CoverFixer")
+
+                if len(content) <= self.max_size:
                     return content
+                log_warning(f"⚠️ Cover zu groß: {len(content)} Bytes. Wird zur Validierung weitergeleitet.", "CoverFixer")
+                # Wir erlauben hier größere Dateien, da die Validierung sie skaliert
+                return content
         except Exception as e:
             log_error(f"❌ Fehler beim Download von {url}: {e}", "CoverFixer")
         return None
@@ -163,7 +194,11 @@ class CoverFixer:
             return None
 
     def embed_cover(self, audio, cover_data: Optional[bytes]) -> bool:
-        """Bettet das Cover in eine Audiodatei ein."""
+        """Bettet das Cover in das übergebene MP4-Objekt ein.
+
+        Die Datei wird hier nicht erneut geöffnet; der Aufrufer nutzt dasselbe
+        Objekt für Prüfung, Einbettung und audio.save().
+        """
         if not cover_data:
             log_warning("Kein Cover zum Einbetten vorhanden", "CoverFixer")
             return False
@@ -33,6 +33,8 @@ class DownloadHandler:
                 error_msg = escape_md_v2(f"{EMOJI['error']} Fehler beim Download: {str(e)}")
                 await msg.edit_text(error_msg, parse_mode="MarkdownV2")
                 log_error(f"handle_youtube_links: {str(e)}", "DownloadHandler")
+            finally:
+                await self.downloader.close()
 
     async def handle_download(self, context: ContextTypes.DEFAULT_TYPE):
         """Behandelt den /download-Befehl zum Herunterladen von YouTube-Audios."""
@@ -53,6 +55,8 @@ class DownloadHandler:
             error_message = f"❌ Ein unerwarteter Fehler ist aufgetreten: {str(e)}"
             log_error(f"Unerwartete Ausnahme in handle_download: {str(e)}", context="DownloadHandler")
             await self.handle_download_failure(status_msg, error_message)
+        finally:
+            await self.downloader.close()
 
     def process_download_result(self, result: Union[Dict[str, Any], str, None]) -> Dict[str, Any]:
         """Verarbeitet das Ergebnis eines Downloads."""
@@ -1,5 +1,5 @@
 import asyncio
-import httpx
+import aiohttp
 import yt_dlp
 import time
 from difflib import SequenceMatcher
@@ -10,8 +10,11 @@ class YouTubeClient:
     """
     YouTube-Client, der Song-Thumbnails durch intelligente Suche mit Caching liefert.
     """
-    def __init__(self):
+    def __init__(self, session: aiohttp.ClientSession | None = None):
         self.cache = {}  # {(artist, title): bytes}
+        # Optional geteilte HTTP-Session (z. B. die des CoverFixer), sonst lazy erzeugt
+        self._session = session
+        self._owns_session = session is None
         self.ydl_base_opts = {
             'format': 'bestaudio/best',
             'noplaylist': True,
@@ -19,6 +22,25 @@ class YouTubeClient:
             'no_warnings': True,
         }
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._owns_session = True
+        return self._session
+
+    async def close(self) -> None:
+        """Schließt die HTTP-Session, sofern sie von diesem Client erzeugt wurde."""
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     async def fetch_thumbnail(self, title: str, artist: str) -> bytes | None:
         query_key = (artist.lower().strip(), title.lower().strip())
         if query_key in self.cache:
@@ -67,13 +89,14 @@ class YouTubeClient:
                 return None
 
             # Lade das Thumbnail
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(thumbnail_url)
+            session = self._get_session()
+            async with session.get(thumbnail_url, timeout=aiohttp.ClientTimeout(total=15.0)) as response:
                 response.raise_for_status()
+                content = await response.read()
 
                 duration = time.perf_counter() - start
-                log_info(f"🖼️ YouTube-Thumbnail geladen ({len(response.content)} Bytes, {duration:.2f}s)", "YouTubeClient")
-                return response.content
+                log_info(f"🖼️ YouTube-Thumbnail geladen ({len(content)} Bytes, {duration:.2f}s)", "YouTubeClient")
+                return content
 
         except Exception as e:
             log_error(f"❌ Fehler bei YouTube-Abfrage ({search_type}): {e}", "YouTubeClient")
@@ -22,8 +22,15 @@ artist_cleaner = CleanArtist()  # Keine Parameter nötig!e
 musicbrainz_client = MusicBrainzClient(artist_cleaner)
 genius_client = GeniusClient(artist_cleaner)
 lastfm_client = LastFMClient()
+# Legt seine HTTP-Session beim ersten Cover-Download an und teilt sie über alle Tracks
 cover_fixer = CoverFixer(musicbrainz_client, genius_client, lastfm_client)
 
+
+async def close_cover_session() -> None:
+    """Schließt die HTTP-Session des modulweiten CoverFixers (beim Herunterfahren aufrufen)"""
+    await cover_fixer.close()
+
+
 class MetadataError(Exception):
     """Custom exception for metadata errors."""
     pass
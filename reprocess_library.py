@@ -1,7 +1,7 @@
 import asyncio
 from pathlib import Path
 from config import Config
-from metadata import process_metadata  # ggf. anpassen
+from metadata import process_metadata, close_cover_session  # ggf. anpassen
 from helfer.extract_info_from_file import extract_info  # erzeugt info-dict aus Datei
 from utils.metadata_writer import write_metadata  # schreibt final in Datei
 from logger import log_info, log_warning
@@ -30,9 +30,12 @@ async def reprocess_library():
     total = len(m4a_files)
     log_info(f"🎧 Starte Reprocessing für {total} .m4a-Dateien in '{library_path}'")
 
-    for idx, file_path in enumerate(m4a_files, 1):
-        await reprocess_file(file_path)
-        print(f"[{idx}/{total}] ✅ {file_path.relative_to(library_path)}")
+    try:
+        for idx, file_path in enumerate(m4a_files, 1):
+            await reprocess_file(file_path)
+            print(f"[{idx}/{total}] ✅ {file_path.relative_to(library_path)}")
+    finally:
+        await close_cover_session()
 
     log_info("🏁 Reprocessing abgeschlossen.")
 
@@ -859,6 +859,10 @@ class YoutubeDownloader(IDownloader):
             "format_error": "❌ Das angeforderte Format ist nicht verfügbar",
         }
 
+    async def close(self) -> None:
+        """Gibt die HTTP-Session des CoverFixers frei."""
+        await self.cover_fixer.close()
+
     async def _clean_cache(self):
         """Entfernt abgelaufene Cache-Einträge."""
         now = datetime.now()
@@ -1286,4 +1290,7 @@ async def download_audio(url: str, update: Update) -> Union[str, List[str]]:
     """
     logger.info(f"Öffentliche API 'download_audio' aufgerufen für URL: {url}")
     downloader = YoutubeDownloader(update)
-    return await downloader.download_audio(url)
\ No newline at end of file
+    try:
+        return await downloader.download_audio(url)
+    finally:
+        await downloader.close()
\ No newline at end of file
@@ -41,6 +41,26 @@ def setup_debug_logging():
     logging.getLogger().setLevel(logging.DEBUG)
 
 
+def iter_audio_files(root: Path, suffixes: Tuple[str, ...]):
+    """Durchläuft root rekursiv per os.scandir und liefert DirEntry-Objekte passender Audiodateien.
+
+    Die DirEntry-Objekte bringen den Dateityp aus dem Verzeichniseintrag mit,
+    sodass pro Eintrag kein zusätzlicher stat-Aufruf nötig ist.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(suffixes) and entry.is_file():
+                        yield entry
+        except OSError as e:
+            logger.warning(f"Verzeichnis konnte nicht gelesen werden: {current}: {e}")
+
+
 class MusicOrganizer:
     """Intelligente Musikorganisation mit erweiterter KÃ¼nstlererkennung"""
 
@@ -586,14 +606,11 @@ class MusicOrganizer:
             logging.error(f"Fehler beim Archivieren von {file_path.name}: {e}")
 
     def _process_file(self, file_path: Path) -> None:
-        """Verarbeitet eine einzelne Datei mit Fehlerklassen-Differenzierung"""
+        """
+        Verarbeitet eine einzelne Datei mit Fehlerklassen-Differenzierung.
+        Erwartet eine Audiodatei aus iter_audio_files (Endung und Dateityp bereits geprüft).
+        """
         try:
-            if (
-                not file_path.is_file()
-                or file_path.suffix.lower() not in Config.SUPPORTED_FORMATS
-            ):
-                return
-
             # PfadlÃ¤ngen-Check (speziell fÃ¼r Windows)
             if platform.system() == "Windows" and len(str(file_path)) > 200:
                 file_path = self._truncate_path(file_path, max_length=200)
@@ -692,8 +709,8 @@ class MusicOrganizer:
         logger.info(f"Starte Verarbeitung von: {self.source_dir}")
 
         # Durchsuche rekursiv alle unterstÃ¼tzten Dateien im Quellverzeichnis
-        for file_path in self.source_dir.rglob("*"):
-            self._process_file(file_path)
+        for entry in iter_audio_files(self.source_dir, Config.SUPPORTED_FORMATS):
+            self._process_file(Path(entry.path))
 
         logger.info(
             f"Verarbeitung abgeschlossen. {self.stats['processed']} Dateien kopiert, "
@@ -1,11 +1,36 @@
 # services/status_service.py
 import asyncio
-from datetime import datetime
+import time
+from dataclasses import dataclass, field
 from logger import logger
 
-# Globale Statusvariablen
-_start_time = datetime.now()
-_active_users = 0
+
+@dataclass(slots=True)
+class ServiceState:
+    """Laufzeitstatus des Bots (ein Objekt pro Prozess)."""
+    active_users: int = 0
+    start_ns: int = field(default_factory=time.monotonic_ns)
+
+
+# Globaler Status
+state = ServiceState()
+
+# Wird gesetzt, sobald sich die Anzahl aktiver User ändert
+_status_changed = asyncio.Event()
+# Maximale Wartezeit ohne Änderung, danach wird trotzdem ein Heartbeat geloggt
+STATUS_HEARTBEAT_INTERVAL = 900
+
+
+def mark_user_active():
+    """Zählt einen aktiven User hoch und weckt das Status-Update."""
+    state.active_users += 1
+    _status_changed.set()
+
+
+def mark_user_inactive():
+    """Zählt einen aktiven User herunter und weckt das Status-Update."""
+    state.active_users = max(0, state.active_users - 1)
+    _status_changed.set()
 
 async def get_status():
     """
@@ -14,39 +39,44 @@ async def get_status():
         dict: Dictionary mit Statusinformationen
             {'active_users': int, 'uptime': str}
     """
-    global _active_users, _start_time
-    
-    uptime = datetime.now() - _start_time
-    uptime_str = str(uptime).split('.')[0]  # Entfernt Mikrosekunden
+    elapsed_s = (time.monotonic_ns() - state.start_ns) // 1_000_000_000
+    minutes, seconds = divmod(elapsed_s, 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    uptime_str = f"{hours}:{minutes:02d}:{seconds:02d}"
+    if days:
+        uptime_str = f"{days} day{'s' if days != 1 else ''}, {uptime_str}"
     
     return {
-        'active_users': _active_users,
+        'active_users': state.active_users,
         'uptime': uptime_str
     }
 
 async def status_update():
-    """Sendet regelmäßige Status-Updates"""
-    global _active_users, _start_time
-    
+    """Loggt den Status bei jeder Änderung, spätestens aber alle 15 Minuten"""
     while True:
         try:
             # Status aktualisieren
             status = await get_status()
             
             logger.info(
-                f"Status Update | "
-                f"Aktive User: {status['active_users']} | "
-                f"Uptime: {status['uptime']}"
+                "Status Update | Aktive User: %d | Uptime: %s",
+                status['active_users'],
+                status['uptime'],
             )
             
-            # Alle 5 Minuten aktualisieren
-            await asyncio.sleep(300)
+            # Auf die nächste Änderung warten (mit Heartbeat-Obergrenze)
+            try:
+                await asyncio.wait_for(_status_changed.wait(), timeout=STATUS_HEARTBEAT_INTERVAL)
+                _status_changed.clear()
+            except asyncio.TimeoutError:
+                pass
             
         except asyncio.CancelledError:
             logger.info("Status-Update wurde abgebrochen")
             break
         except Exception as e:
-            logger.error(f"Fehler im Status-Update: {e}")
+            logger.error("Fehler im Status-Update: %s", e)
             await asyncio.sleep(60)  # Bei Fehlern 1 Minute warten
 
 # Testfunktion für lokales Debugging
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Unit-Tests für das Modul artist_map.
+
+Diese Testsuite überprüft die Funktion `clean_artist_name`, insbesondere
+Trennzeichen, Bindestrich-Namen, Kanal-Zusätze und Leerzeichen nach der Bereinigung.
+"""
+
+import unittest
+from artist_map import clean_artist_name, clean_artist_names
+
+class TestArtistMap(unittest.TestCase):
+    """
+    Testklasse für die Funktion clean_artist_name.
+
+    Jede Methode deckt einen Fall ab, der bei einer früheren Änderung
+    der Bereinigungsregeln kaputtgegangen war.
+    """
+
+    def test_x_inside_name_is_not_a_separator(self):
+        """Testet, dass ein 'x' innerhalb eines Wortes nicht als Trennzeichen gilt."""
+        self.assertEqual(clean_artist_name("Maxwell"), "Maxwell")
+        self.assertEqual(clean_artist_name("Alex"), "Alex")
+
+    def test_x_between_artists_is_a_separator(self):
+        """Testet, dass ein freistehendes 'x' zwei Künstler trennt."""
+        self.assertEqual(clean_artist_name("A x B"), "A, B")
+        self.assertEqual(clean_artist_name("Max x Alex"), "Max, Alex")
+
+    def test_hyphenated_names_stay_intact(self):
+        """Testet, dass Bindestriche innerhalb eines Namens erhalten bleiben."""
+        self.assertEqual(clean_artist_name("Jay-Z"), "Jay-Z")
+        self.assertEqual(clean_artist_name("T-Low"), "T-Low")
+
+    def test_vevo_suffix_is_removed(self):
+        """Testet das Entfernen von 'VEVO' als Suffix und als eigenes Wort."""
+        self.assertEqual(clean_artist_name("TaylorSwiftVEVO"), "Taylor Swift")
+        self.assertEqual(clean_artist_name("Shindy VEVO"), "Shindy")
+
+    def test_noise_word_inside_name_is_kept(self):
+        """Testet, dass Zusätze wie 'vevo' oder 'ytb' nur als ganze Wörter entfernt werden."""
+        self.assertEqual(clean_artist_name("Vevolution"), "Vevolution")
+        self.assertEqual(clean_artist_name("Ytbeats"), "Ytbeats")
+
+    def test_noise_only_name_is_kept(self):
+        """Testet, dass ein Name nur aus Zusätzen nicht zu einem leeren String wird."""
+        self.assertEqual(clean_artist_name("VEVO"), "VEVO")
+        self.assertEqual(clean_artist_name("(Official Video)"), "(Official Video)")
+
+    def test_noise_removed_from_title_suffix(self):
+        """Testet das Entfernen von Video-Zusätzen hinter dem Namen."""
+        self.assertEqual(clean_artist_name("Apache 207 (Official Video)"), "Apache 207")
+
+    def test_trailing_dash_does_not_break_override(self):
+        """Testet, dass nach der Bindestrich-Regel kein Leerzeichen den Override-Lookup verhindert."""
+        self.assertEqual(clean_artist_name("raf -"), "RAF Camora")
+        self.assertEqual(clean_artist_name("Raf Camora - Topic"), "RAF Camora")
+
+    def test_surrounding_whitespace_is_trimmed(self):
+        """Testet das Entfernen von Leerzeichen am Anfang und Ende."""
+        self.assertEqual(clean_artist_name("  Luciano  "), "Luciano")
+
+    def test_empty_name(self):
+        """Testet einen leeren Namen."""
+        self.assertEqual(clean_artist_name(""), "")
+
+    def test_batch_matches_single_calls(self):
+        """Testet, dass clean_artist_names dieselben Ergebnisse wie Einzelaufrufe liefert."""
+        names = ["Jay-Z", "VEVO", "A x B", "raf -"]
+        self.assertEqual(clean_artist_names(names), [clean_artist_name(n) for n in names])
+
+if __name__ == '__main__':
+    unittest.main()
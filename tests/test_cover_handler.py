@@ -48,6 +48,9 @@ async def test_cover_handler():
             log_info("✅ Cover bereits vorhanden")
     except Exception as e:
         log_error(f"❌ Fehler bei der Verarbeitung: {str(e)}")
+    finally:
+        await cover_fixer.close()
+        await youtube_client.close()
 
 if __name__ == "__main__":
     asyncio.run(test_cover_handler())
\ No newline at end of file
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Unit-Tests für das Modul genre_map.
+
+Diese Testsuite überprüft die Funktion `clean_genre_name`, die rohe Genre-Tags
+auf kanonische Genre-Namen abbildet.
+"""
+
+import unittest
+from genre_map import clean_genre_name
+
+class TestGenreMap(unittest.TestCase):
+    """
+    Testklasse für die Funktion clean_genre_name.
+    """
+
+    def test_separator_only_input(self):
+        """Testet, dass eine Eingabe nur aus Trennzeichen kein ', ' als Genre liefert."""
+        self.assertEqual(clean_genre_name(", "), "Unbekannt")
+
+    def test_empty_input(self):
+        """Testet eine leere Eingabe."""
+        self.assertEqual(clean_genre_name(""), "Unbekannt")
+
+    def test_hip_hop_variants(self):
+        """Testet, dass verschiedene Hip-Hop-Schreibweisen auf 'Hip Hop' abgebildet werden."""
+        for raw in ("Deutschrap", "german hip hop", "Rap / Hip-Hop", "hiphop or rap"):
+            with self.subTest(raw=raw):
+                self.assertEqual(clean_genre_name(raw), "Hip Hop")
+
+    def test_canonical_casing(self):
+        """Testet die kanonische Schreibweise trotz Groß-/Kleinschreibung und Leerzeichen."""
+        self.assertEqual(clean_genre_name("  ROCK  "), "Rock")
+        self.assertEqual(clean_genre_name("rnb"), "R&B")
+        self.assertEqual(clean_genre_name("R&B"), "R&B")
+
+    def test_unmapped_genre_is_kept(self):
+        """Testet, dass ein bekanntes Genre ohne Regel unverändert bleibt."""
+        self.assertEqual(clean_genre_name("Electronic"), "Electronic")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Unit-Tests für LFUCache aus utils.py.
+
+Diese Testsuite überprüft die O(1)-Verdrängung des LFU-Caches: die Reihenfolge
+nach Zugriffszähler und Alter, cache_clear und rekursive Aufrufe der dekorierten
+Funktion. Nach jedem Schritt werden die Invarianten der Frequenz-Buckets geprüft.
+"""
+
+import importlib.util
+import random
+import sys
+import unittest
+from pathlib import Path
+
+# utils.py liegt neben dem Paket utils/, das bei "import utils" Vorrang hätte
+_UTILS_PATH = Path(__file__).resolve().parent.parent / "utils.py"
+if "utils" not in sys.modules or not hasattr(sys.modules["utils"], "LFUCache"):
+    _spec = importlib.util.spec_from_file_location("utils", _UTILS_PATH)
+    _module = importlib.util.module_from_spec(_spec)
+    sys.modules["utils"] = _module
+    _spec.loader.exec_module(_module)
+LFUCache = sys.modules["utils"].LFUCache
+
+class TestLFUCache(unittest.TestCase):
+    """
+    Testklasse für LFUCache.
+    """
+
+    def assert_invariants(self, cache):
+        """Prüft, dass cache und freq_buckets zueinander passen."""
+        self.assertLessEqual(len(cache.cache), cache.maxsize)
+        self.assertEqual(sum(len(b) for b in cache.freq_buckets.values()), len(cache.cache))
+        for freq, bucket in cache.freq_buckets.items():
+            self.assertTrue(bucket, f"leerer Bucket für Zähler {freq}")
+            for key in bucket:
+                self.assertEqual(cache.cache[key][1], freq)
+        if cache.cache:
+            self.assertEqual(cache.min_freq, min(cache.freq_buckets))
+
+    def make_cached(self, maxsize):
+        """Erzeugt eine dekorierte Funktion und protokolliert echte Aufrufe."""
+        cache = LFUCache(maxsize=maxsize)
+        calls = []
+
+        @cache.decorator
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        return cache, square, calls
+
+    def test_evicts_oldest_entry_with_lowest_frequency(self):
+        """Testet, dass bei gleichem Zähler der älteste Eintrag verdrängt wird."""
+        cache, square, calls = self.make_cached(3)
+        for x in (1, 2, 3):
+            square(x)
+        square(4)  # 1, 2, 3 haben Zähler 1 → 1 ist am ältesten
+        self.assert_invariants(cache)
+        calls.clear()
+        square(1)
+        self.assertEqual(calls, [1])
+
+    def test_evicts_lowest_frequency_first(self):
+        """Testet, dass häufig genutzte Einträge seltener genutzte überleben."""
+        cache, square, calls = self.make_cached(3)
+        for x in (1, 2, 3):
+            square(x)
+        square(1)
+        square(1)
+        square(2)
+        square(4)  # 3 hat als einziger Zähler 1
+        self.assert_invariants(cache)
+        calls.clear()
+        for x in (1, 2, 4):
+            square(x)
+        self.assertEqual(calls, [])
+        square(3)
+        self.assertEqual(calls, [3])
+
+    def test_min_freq_after_touching_last_minimum(self):
+        """Testet min_freq, wenn der letzte Eintrag mit dem niedrigsten Zähler getroffen wird."""
+        cache, square, calls = self.make_cached(2)
+        square(1)
+        square(1)
+        square(2)
+        square(2)
+        square(2)  # Zähler 1 → 2, 2 → 4; min_freq muss auf 2 steigen
+        self.assert_invariants(cache)
+        self.assertEqual(cache.min_freq, 2)
+        square(3)  # verdrängt 1 (Zähler 2) statt 2 (Zähler 4)
+        self.assert_invariants(cache)
+        calls.clear()
+        square(2)
+        self.assertEqual(calls, [])
+
+    def test_random_access_keeps_invariants(self):
+        """Testet die Bucket-Invarianten bei zufälligen Zugriffsmustern."""
+        rng = random.Random(1234)
+        for maxsize in (1, 2, 5, 16):
+            cache, square, _ = self.make_cached(maxsize)
+            for _ in range(2000):
+                x = rng.randint(0, 3 * maxsize)
+                self.assertEqual(square(x), x * x)
+                self.assert_invariants(cache)
+
+    def test_cache_clear(self):
+        """Testet, dass cache_clear alle Einträge und Buckets entfernt."""
+        cache, square, calls = self.make_cached(3)
+        for x in (1, 2, 2, 3):
+            square(x)
+        square.cache_clear()
+        self.assertEqual(cache.cache, {})
+        self.assertEqual(cache.freq_buckets, {})
+        self.assertEqual(cache.min_freq, 0)
+        calls.clear()
+        square(2)
+        self.assertEqual(calls, [2])
+        self.assert_invariants(cache)
+
+    def test_recursive_call_with_same_key(self):
+        """Testet, dass ein rekursiver Aufruf mit gleichem Schlüssel keinen Doppeleintrag erzeugt."""
+        cache = LFUCache(maxsize=2)
+        calls = []
+
+        @cache.decorator
+        def double(x):
+            calls.append(x)
+            if len(calls) == 1:
+                # trägt den Schlüssel vor dem äußeren Aufruf ein und erhöht seinen Zähler
+                double(x)
+                double(x)
+            return x * 2
+
+        double(1)
+        self.assert_invariants(cache)
+        self.assertEqual(cache.cache[cache._make_key((1,), {})][1], 2)
+        double(0)
+        double(5)
+        self.assert_invariants(cache)
+        self.assertEqual(len(cache.cache), 2)
+
+    def test_recursive_calls_with_eviction(self):
+        """Testet rekursive Aufrufe, die während der Berechnung verdrängen."""
+        cache = LFUCache(maxsize=3)
+
+        @cache.decorator
+        def fib(n):
+            return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+        self.assertEqual(fib(20), 6765)
+        self.assert_invariants(cache)
+        self.assertEqual(fib(25), 75025)
+        self.assert_invariants(cache)
+
+if __name__ == '__main__':
+    unittest.main()
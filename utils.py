@@ -5,15 +5,18 @@ import argparse
 import asyncio
 import os
 import re
-import shutil
 import unicodedata
 import logging
+import multiprocessing
 import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from difflib import SequenceMatcher
 from functools import lru_cache, wraps, partial  # Hinzugefügt für besseres Caching
 import json  # Für Serialisierung von Dicts
 from pathlib import Path
+from sys import intern
 from typing import (
     Any,
     Dict,
@@ -22,7 +25,6 @@ from typing import (
     Tuple,
     Union,
     TypedDict,
-    Callable,
     Set,
     FrozenSet,
 )
@@ -30,13 +32,37 @@ from dataclasses import (
     dataclass,
     field,
 )  # Implementierung von Verbesserungsvorschlag #5
-from collections import Counter  # Für LFU Cache Implementierung
 
 # Externe Abhängigkeiten
+import aiohttp
 import mutagen
 from mutagen.mp4 import MP4, MP4Cover
 from mutagen import MutagenError
 
+try:
+    from rapidfuzz.fuzz import ratio as _rf_ratio
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+try:
+    import psutil
+    HAS_PSUTIL = True
+except ImportError:
+    HAS_PSUTIL = False
+
 # Lokale Module
 from config import Config
 from logger import log_error
@@ -45,6 +71,21 @@ from klassen.artist_map import GENRE_MAP
 # Logger konfigurieren - Verbesserungsvorschlag #10
 logger = logging.getLogger(__name__)
 
+
+# JSON-Formatter für strukturierte Logs (einmalig definiert)
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        log_data = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "name": record.name,
+            "message": record.getMessage(),
+        }
+        if hasattr(record, "data"):
+            log_data["data"] = record.data
+        return json.dumps(log_data)
+
+
 # ---------------------------
 # Datei- und Namensoperationen
 # ---------------------------
@@ -60,20 +101,43 @@ FEAT_PATTERNS = [
         r"&\s+([^)]+)",
     ]
 ]
+# Gemeinsamer Vorfilter: enthält ein Titel keines dieser Schlüsselwörter,
+# kann keines der FEAT_PATTERNS treffen.
+FEAT_PREFILTER_PATTERN = re.compile(r"feat|ft|with|&", re.IGNORECASE)
 
 # Verbesserungsvorschlag #4: Konsistente Regex-Nutzung
-TRACK_NUMBER_PATTERN = re.compile(r"(\d+)")
+TRACK_NUMBER_PATTERN = re.compile(r"(\d+)", re.ASCII)  # Tracknummern sind ASCII-Ziffern
 
 # String Pattern für Dateinamenbereinigung
 ILLEGAL_CHARS_PATTERN = re.compile(r'[<>:"/\\|?*\x00-\x1F]')
 FEAT_NOTATION_PATTERN = re.compile(r"\s*\(feat\.\s+([^)]+)\)")
 EXTRA_SPACES_PATTERN = re.compile(r"\s+")
+# Verbotene Zeichen und Leerraum in einem Durchlauf zu einem Leerzeichen
+# zusammenfassen (verbotene Zeichen würden ohnehin zu Leerzeichen)
+SANITIZE_SEPARATORS_PATTERN = re.compile(r'[\s<>:"/\\|?*\x00-\x1F]+')
 
 # Artist Patterns
 ARTIST_CLEANUP_PATTERN = re.compile(
     r"( - Topic| - .*Official.*|VEVO|Official.*|\(.*\)|\[.*\]|\s*-\s*$)", re.IGNORECASE
 )
 ARTIST_SPLIT_PATTERN = re.compile(r"[,x&]|feat\.?")
+# Erster Titel-Trenner (" - ", "–", "—") oder Multi-Artist-Trenner - alles davor ist der erste Artist
+FIRST_ARTIST_END_PATTERN = re.compile(r"\s*[-–—]|,|&|feat\.|ft\.|with", re.IGNORECASE)
+
+# Für MetadataManager.clean_title
+PAREN_SUFFIX_PATTERN = re.compile(r"\s*\(.*?\)")
+TITLE_ARTIST_SPLIT_PATTERN = re.compile(r",|&|feat\.|ft\.|with")
+
+# "Artist - Titel" im Titel-Tag
+ARTIST_TITLE_PATTERN = re.compile(r"(?P<artist>.+?)\s*[-–]\s*(?P<title>.+)")
+
+# Aus der Config abgeleitete Lookup-Tabellen (zur Laufzeit unveränderlich)
+_BAD_ARTISTS = frozenset(
+    a.lower() for a in Config.ORGANIZER_CONFIG.get("replace_artist_from_title_if", [])
+)
+_ARTIST_OVERRIDES_LC = {k.lower(): v for k, v in Config.ARTIST_NAME_OVERRIDES.items()}
+_DEFAULT_ALBUM = Config.DEFAULT_ALBUM_NAME
+_METADATA_DEFAULTS = Config.METADATA_DEFAULTS
 
 # Albumnamen-Patterns (Verbesserungsvorschlag #4)
 ALBUM_PATTERNS = [
@@ -163,48 +227,43 @@ class DynamicLRUCache:
 
 # Verbesserungsvorschlag #1: LFU Cache implementieren
 class LFUCache:
-    """Least Frequently Used (LFU) Cache Implementierung"""
+    """Least Frequently Used (LFU) Cache als Decorator mit O(1)-Verdrängung"""
 
     def __init__(self, maxsize=1024):
         self.maxsize = maxsize
-        self.cache = {}
-        self.key_count = Counter()
+        self.cache = {}  # key -> (Ergebnis, Zugriffszähler)
+        # Zugriffszähler -> Schlüssel in Einfügereihenfolge (älteste zuerst)
+        self.freq_buckets: Dict[int, OrderedDict] = {}
+        self.min_freq = 0
         self.sentinel = object()  # Für Cache-Miss Erkennung
 
     def _make_key(self, args, kwargs):
         """Erstellt einen hashbaren Schlüssel aus Funktionsargumenten"""
-        key_parts = []
-
-        # Verarbeite normale Argumente
-        for arg in args:
-            if isinstance(arg, dict):
-                # Dictionaries sind nicht hashbar
-                arg_key = frozenset((k, self._make_hashable(v)) for k, v in arg.items())
-            elif isinstance(arg, list):
-                # Listen sind nicht hashbar
-                arg_key = tuple(self._make_hashable(v) for v in arg)
-            else:
-                arg_key = arg
-            key_parts.append(arg_key)
-
-        # Verarbeite Keyword-Argumente
-        kw_parts = []
-        for k, v in sorted(kwargs.items()):
-            kw_parts.append((k, self._make_hashable(v)))
-        key_parts.append(tuple(kw_parts))
-
-        return hash(tuple(key_parts))
-
-    def _make_hashable(self, obj):
-        """Konvertiert unhashbare Objekte zu hashbaren Repräsentationen"""
-        if isinstance(obj, dict):
-            return frozenset((k, self._make_hashable(v)) for k, v in obj.items())
-        elif isinstance(obj, list):
-            return tuple(self._make_hashable(v) for v in obj)
-        elif isinstance(obj, set):
-            return frozenset(self._make_hashable(v) for v in obj)
-        else:
-            return obj
+        return make_cache_key((args, kwargs))
+
+    def _touch(self, key, result, freq):
+        """Verschiebt einen Schlüssel von Bucket freq nach freq + 1"""
+        bucket = self.freq_buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self.freq_buckets[freq]
+            if self.min_freq == freq:
+                self.min_freq = freq + 1
+        self.freq_buckets.setdefault(freq + 1, OrderedDict())[key] = None
+        self.cache[key] = (result, freq + 1)
+
+    def _evict(self):
+        """Entfernt den ältesten Eintrag mit dem niedrigsten Zugriffszähler"""
+        bucket = self.freq_buckets[self.min_freq]
+        key, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self.freq_buckets[self.min_freq]
+        del self.cache[key]
+
+    def clear(self):
+        self.cache.clear()
+        self.freq_buckets.clear()
+        self.min_freq = 0
 
     def decorator(self, func):
         @wraps(func)
@@ -212,33 +271,28 @@ class LFUCache:
             # Erstelle hashbaren Schlüssel
             key = self._make_key(args, kwargs)
 
-            # Prüfe Cache
-            result = self.cache.get(key, self.sentinel)
-            if result is not self.sentinel:
-                # Cache Hit
-                self.key_count[key] += 1
+            # Prüfe Cache und erhöhe bei Treffer den Zugriffszähler
+            entry = self.cache.get(key, self.sentinel)
+            if entry is not self.sentinel:
+                result, freq = entry
+                self._touch(key, result, freq)
                 return result
 
-            # Cache Miss
+            # Cache Miss - bei vollem Cache den seltensten Eintrag verdrängen
             result = func(*args, **kwargs)
-
-            # Cache aktualisieren
+            if key in self.cache:
+                # Rekursiver Aufruf hat den Schlüssel bereits eingetragen
+                return result
             if len(self.cache) >= self.maxsize:
-                # Entferne am wenigsten verwendeten Eintrag
-                least_common = self.key_count.most_common()[:-2:-1]
-                if least_common:  # Sicherstellen, dass wir einen Eintrag haben
-                    lc_key = least_common[0][0]
-                    del self.cache[lc_key]
-                    del self.key_count[lc_key]
-
-            # Neuen Eintrag hinzufügen
-            self.cache[key] = result
-            self.key_count[key] = 1
+                self._evict()
+            self.cache[key] = (result, 1)
+            self.freq_buckets.setdefault(1, OrderedDict())[key] = None
+            self.min_freq = 1
 
             return result
 
         # Cache-Operationen zugänglich machen
-        wrapper.cache_clear = lambda: (self.cache.clear(), self.key_count.clear())
+        wrapper.cache_clear = self.clear
         wrapper.cache_info = (
             lambda: f"Cache size: {len(self.cache)}, Max size: {self.maxsize}"
         )
@@ -246,23 +300,70 @@ class LFUCache:
         return wrapper
 
 
+# Cache-Größen einmalig beim Import anhand des verfügbaren RAMs festlegen -
+# lru_cache lässt sich nachträglich nicht vergrößern
+LARGE_MEMORY_THRESHOLD = 4 * 1024 * 1024 * 1024  # 4 GB
+AVAILABLE_MEMORY = psutil.virtual_memory().available if HAS_PSUTIL else 0
+STRING_CACHE_SIZE = 8192 if AVAILABLE_MEMORY > LARGE_MEMORY_THRESHOLD else 2048
+
 # Erzeugen von Cache-Instanzen für verschiedene Zwecke
-string_cache = DynamicLRUCache(initial_size=2048, max_size=10000)
+string_cache = DynamicLRUCache(initial_size=STRING_CACHE_SIZE, max_size=10000)
 metadata_cache = DynamicLRUCache(initial_size=512, max_size=2000)
 lfu_cache = LFUCache(maxsize=2048)
 
 
+def _indel_ratio(a: str, b: str) -> float:
+    """Normalisierte Indel-Ähnlichkeit 2*LCS/(len(a)+len(b)), identisch zu rapidfuzz.fuzz.ratio"""
+    total = len(a) + len(b)
+    if not total:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    # Bitparallele LCS-Länge (Hyyrö): ein Bit pro Zeichen von a
+    masks: Dict[str, int] = {}
+    for i, ch in enumerate(a):
+        masks[ch] = masks.get(ch, 0) | (1 << i)
+    full = (1 << len(a)) - 1
+    v = full
+    for ch in b:
+        u = v & masks.get(ch, 0)
+        v = ((v + u) | (v - u)) & full
+    lcs = len(a) - bin(v).count("1")
+    return 2.0 * lcs / total
+
+
 def similarity(a: str, b: str) -> float:
     """Return a similarity ratio between two strings."""
-    return SequenceMatcher(
-        None, sanitize_filename(a).lower().strip(), sanitize_filename(b).lower().strip()
-    ).ratio()
+    a = sanitize_for_compare(a)
+    b = sanitize_for_compare(b)
+    if HAS_RAPIDFUZZ:
+        # C++-Implementierung derselben Kennzahl, um ein Vielfaches schneller
+        return _rf_ratio(a, b) / 100.0
+    return _indel_ratio(a, b)
+
+
+# Kurze ASCII-Namen ohne "feat."-Notation sind schneller direkt bereinigt als
+# über den Cache nachgeschlagen - sie würden den Cache nur mit billigen Einträgen füllen
+SANITIZE_CACHE_MIN_LENGTH = 16
 
 
-# Verbesserungsvorschlag #1 und #7: Optimierte Dateinamenbereinigung mit dynamischem Caching
-@string_cache.decorator
 def sanitize_filename(filename: Optional[Any]) -> str:
     """Bereinigt Dateinamen mit Unicode-Normalisierung und Ersetzung unerwünschter Zeichen"""
+    if (
+        type(filename) is str
+        and len(filename) <= SANITIZE_CACHE_MIN_LENGTH
+        and filename.isascii()
+        and "(feat." not in filename
+    ):
+        # Entspricht dem Ergebnis von _sanitize_filename_cached für diese Eingaben
+        return SANITIZE_SEPARATORS_PATTERN.sub(" ", filename).strip()
+    return _sanitize_filename_cached(filename)
+
+
+# Verbesserungsvorschlag #1 und #7: Optimierte Dateinamenbereinigung mit dynamischem Caching
+@string_cache.decorator
+def _sanitize_filename_cached(filename: Optional[Any]) -> str:
+    """Gecachter Kern von sanitize_filename für lange oder nicht-ASCII-Namen"""
     try:
         if filename is None:
             return ""
@@ -274,19 +375,23 @@ def sanitize_filename(filename: Optional[Any]) -> str:
         if len(filename) > Config.MAX_FILENAME_LENGTH:
             filename = filename[: Config.MAX_FILENAME_LENGTH]
 
-        # Unicode Normalization
-        filename = unicodedata.normalize("NFC", filename)
+        # Unicode Normalization - ASCII ist immer NFC, sonst erst per Quick Check prüfen
+        if not filename.isascii() and not unicodedata.is_normalized("NFC", filename):
+            filename = unicodedata.normalize("NFC", filename)
 
-        # Ersetze verbotene Zeichen mit vorcompilierten Patterns - Verbesserungsvorschlag #4
-        filename = ILLEGAL_CHARS_PATTERN.sub(" ", filename)
+        if "(feat." in filename:
+            # Ersetze verbotene Zeichen mit vorcompilierten Patterns - Verbesserungsvorschlag #4
+            filename = ILLEGAL_CHARS_PATTERN.sub(" ", filename)
 
-        # Behalte "feat."-Notation bei
-        filename = FEAT_NOTATION_PATTERN.sub(" feat. \\1", filename)
+            # Behalte "feat."-Notation bei
+            filename = FEAT_NOTATION_PATTERN.sub(" feat. \\1", filename)
 
-        # Bereinige überflüssige Leerzeichen
-        filename = EXTRA_SPACES_PATTERN.sub(" ", filename).strip()
+            # Bereinige überflüssige Leerzeichen
+            return EXTRA_SPACES_PATTERN.sub(" ", filename).strip()
 
-        return filename
+        # Ohne "feat."-Notation: verbotene Zeichen und überflüssige Leerzeichen
+        # in einem einzigen Durchlauf ersetzen
+        return SANITIZE_SEPARATORS_PATTERN.sub(" ", filename).strip()
 
     except Exception as e:
         log_error(
@@ -296,6 +401,16 @@ def sanitize_filename(filename: Optional[Any]) -> str:
         return "ungueltiger_dateiname"
 
 
+sanitize_filename.cache_info = _sanitize_filename_cached.cache_info
+sanitize_filename.cache_clear = _sanitize_filename_cached.cache_clear
+
+
+@string_cache.decorator
+def sanitize_for_compare(value: Optional[Any]) -> str:
+    """Bereinigte, kleingeschriebene Form eines Strings für Vergleiche (gecacht)"""
+    return sanitize_filename(value).lower().strip()
+
+
 # ---------------------------
 # I/O-Operationen mit Semaphore und besserer Parallelisierung
 # ---------------------------
@@ -304,98 +419,84 @@ def sanitize_filename(filename: Optional[Any]) -> str:
 # Begrenzt die Anzahl gleichzeitiger I/O-Operationen
 IO_SEMAPHORE = asyncio.Semaphore(20)  # Anpassbar je nach System
 
-# I/O Operation Buffer - Verbesserungsvorschlag #3
-IO_BUFFER = {}
-IO_BUFFER_LOCK = asyncio.Lock()
-IO_BUFFER_MAX_SIZE = 100
-
+# Eigener Thread-Pool für Umbenennungen: die Syscalls laufen tatsächlich parallel,
+# die Pool-Größe begrenzt gleichzeitig die Anzahl offener Operationen.
+RENAME_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="rename")
 
-async def buffer_operation(key: str, operation: Callable, *args, **kwargs) -> Any:
-    """Puffert I/O-Operationen und führt sie in Batches aus"""
-    async with IO_BUFFER_LOCK:
-        if key not in IO_BUFFER:
-            IO_BUFFER[key] = []
-        IO_BUFFER[key].append((operation, args, kwargs))
-
-        # Wenn der Puffer voll ist oder dieser Schlüssel bereits viele Einträge hat,
-        # führe die Operationen aus
-        if len(IO_BUFFER) > IO_BUFFER_MAX_SIZE or len(IO_BUFFER[key]) > 10:
-            return await flush_buffer(key)
+# Eigener Thread-Pool für mutagen-Lese-/Schreibzugriffe, damit Metadaten-Jobs nicht
+# hinter anderen Aufgaben im Default-Executor warten (mutagen gibt bei I/O die GIL frei)
+METADATA_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(16, (os.cpu_count() or 4) * 2), thread_name_prefix="meta"
+)
 
-    # Kein sofortiges Ausführen nötig
-    return None
+# Prozess-Pool für große Verzeichnisse: das Parsen der Tags ist GIL-gebundene
+# Python-Arbeit und skaliert erst über mehrere Prozesse
+_METADATA_PROC_MAX_WORKERS = min(4, os.cpu_count() or 1)
 
 
-async def flush_buffer(key: Optional[str] = None) -> Any:
-    """Führt gepufferte Operationen aus"""
-    result = None
-    async with IO_BUFFER_LOCK:
-        if key is not None and key in IO_BUFFER:
-            operations = IO_BUFFER.pop(key)
-            for op, args, kwargs in operations:
-                # Die letzte Operation bestimmt das Ergebnis
-                result = await op(*args, **kwargs)
-        elif key is None:
-            # Alle Operationen ausführen
-            all_keys = list(IO_BUFFER.keys())
-            for k in all_keys:
-                operations = IO_BUFFER.pop(k)
-                for op, args, kwargs in operations:
-                    await op(*args, **kwargs)
-    return result
+def _new_metadata_process_pool() -> ProcessPoolExecutor:
+    """
+    Erzeugt einen Prozess-Pool für einen einzelnen großen Metadaten-Batch.
+    "spawn" statt "fork": im Bot laufen zu diesem Zeitpunkt bereits Threads,
+    deren Locks (z.B. die der Logging-Handler) ein geforkter Worker gesperrt erben könnte.
+    """
+    return ProcessPoolExecutor(
+        max_workers=_METADATA_PROC_MAX_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
 
 
 # Implementierung von Verbesserungsvorschlag #3: Plattformspezifisches, atomisches Umbenennen
 async def atomic_rename(src: Union[str, Path], dest: Union[str, Path]) -> bool:
-    """Führt ein atomisches Umbenennen durch, falls vom Betriebssystem unterstützt"""
-    src_path = Path(src)
-    dest_path = Path(dest)
-
-    # Sicherstellen, dass das Zielverzeichnis existiert
-    dest_path.parent.mkdir(parents=True, exist_ok=True)
-
+    """Führt ein atomisches Umbenennen im Rename-Thread-Pool durch"""
+    loop = asyncio.get_running_loop()
     try:
-        if os.name == "posix":
-            # Auf POSIX-Systemen ist os.rename atomar
-            os.rename(str(src_path), str(dest_path))
-        else:
-            # Auf Windows versuchen wir es mit shutil.move
-            shutil.move(str(src_path), str(dest_path))
+        await loop.run_in_executor(RENAME_EXECUTOR, _atomic_rename_sync, src, dest)
         return True
     except Exception as e:
         logger.error(f"Atomisches Umbenennen fehlgeschlagen: {e}")
         return False
 
 
+def _atomic_rename_sync(src: Union[str, Path], dest: Union[str, Path]) -> None:
+    """Benennt atomar um; wirft bei Fehlern"""
+    # Direkt mit os.path arbeiten, ohne Path-Objekte zu erzeugen
+    dest_dir = os.path.dirname(dest)
+    if dest_dir:
+        # Sicherstellen, dass das Zielverzeichnis existiert
+        os.makedirs(dest_dir, exist_ok=True)
+
+    # os.replace ist auf POSIX (rename) und Windows (MoveFileEx) atomar
+    # und überschreibt ein vorhandenes Ziel
+    os.replace(src, dest)
+
+
 async def safe_rename(
     src: Union[str, Path], dest: Union[str, Path], max_retries: int = 3
 ) -> bool:
-    """Robustes Umbenennen mit Wiederholungslogik und Semaphor für begrenzte Parallelität"""
-    src_path = Path(src)
-    dest_path = Path(dest)
+    """Robustes Umbenennen mit Wiederholungslogik; die Parallelität begrenzt RENAME_EXECUTOR"""
+    src = os.fspath(src)
+    dest = os.fspath(dest)
 
-    if not src_path.exists():
+    if not os.path.exists(src):
         return False
 
-    # Verbesserungsvorschlag #2: Semaphore für begrenzte Parallelität
-    async with IO_SEMAPHORE:
-        # Versuche zuerst atomisches Umbenennen
-        if await atomic_rename(src_path, dest_path):
+    # Atomisches Umbenennen, bei vorübergehenden Fehlern mit Wiederholungen
+    loop = asyncio.get_running_loop()
+    for attempt in range(max_retries):
+        try:
+            await loop.run_in_executor(
+                RENAME_EXECUTOR, _atomic_rename_sync, src, dest
+            )
             return True
-
-        # Fallback: Mit Wiederholungen
-        for attempt in range(max_retries):
-            try:
-                os.rename(str(src_path), str(dest_path))
-                return True
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    logger.error(
-                        f"Umbenennen fehlgeschlagen nach {max_retries} Versuchen: {e}"
-                    )
-                    raise
-                await asyncio.sleep(1)
-        return False
+        except Exception as e:
+            if attempt == max_retries - 1:
+                logger.error(
+                    f"Umbenennen fehlgeschlagen nach {max_retries} Versuchen: {e}"
+                )
+                raise
+            await asyncio.sleep(1)
+    return False
 
 
 # Verbesserungsvorschlag #2: Chunking für Batch-Verarbeitung großer Listen
@@ -403,7 +504,7 @@ async def batch_rename(
     src_dest_pairs: List[Tuple[Union[str, Path], Union[str, Path]]],
     chunk_size: int = 50,
 ) -> List[bool]:
-    """Verarbeitet mehrere Umbenennungsoperationen in Chunks"""
+    """Verarbeitet mehrere Umbenennungsoperationen in Chunks über den Rename-Thread-Pool"""
     results = []
 
     # Verarbeite die Liste in Chunks
@@ -420,15 +521,11 @@ async def batch_rename(
         ]
         results.extend(processed_results)
 
-        # Kurze Pause zwischen Chunks
-        if i + chunk_size < len(src_dest_pairs):
-            await asyncio.sleep(0.1)
-
     return results
 
 
 # Datei-Cache für häufig verwendete Dateien - Verbesserungsvorschlag #3
-FILE_CACHE = {}
+FILE_CACHE: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()  # LRU: ältester Eintrag vorne
 FILE_CACHE_MAX_SIZE = 50  # MB
 FILE_CACHE_CURRENT_SIZE = 0
 FILE_CACHE_LOCK = asyncio.Lock()
@@ -436,15 +533,16 @@ FILE_CACHE_LOCK = asyncio.Lock()
 
 async def cache_file(filepath: Union[str, Path]) -> bool:
     """Lädt eine Datei in den Cache"""
-    path = Path(filepath)
+    path = os.fspath(filepath)
     global FILE_CACHE_CURRENT_SIZE
 
-    if not path.exists():
+    try:
+        size_mb = os.stat(path).st_size / (1024 * 1024)
+    except OSError:
+        # Fehlt die Datei oder ist ein Pfadteil kein Verzeichnis (NotADirectoryError)
         return False
 
     try:
-        size_mb = path.stat().st_size / (1024 * 1024)
-
         # Prüfe, ob die Datei in den Cache passt
         if (
             size_mb > FILE_CACHE_MAX_SIZE * 0.5
@@ -454,18 +552,18 @@ async def cache_file(filepath: Union[str, Path]) -> bool:
         async with FILE_CACHE_LOCK:
             # Cache aufräumen, wenn er zu groß wird
             if FILE_CACHE_CURRENT_SIZE + size_mb > FILE_CACHE_MAX_SIZE:
-                # Entferne die ältesten Einträge
+                # Entferne die am längsten nicht genutzten Einträge
                 while (
                     FILE_CACHE
                     and FILE_CACHE_CURRENT_SIZE + size_mb > FILE_CACHE_MAX_SIZE * 0.8
                 ):
-                    _, oldest_size = FILE_CACHE.popitem()
+                    _, (_, oldest_size) = FILE_CACHE.popitem(last=False)
                     FILE_CACHE_CURRENT_SIZE -= oldest_size
 
             # Datei in den Cache laden
             with open(path, "rb") as f:
                 content = f.read()
-                FILE_CACHE[str(path)] = (content, size_mb)
+                FILE_CACHE[path] = (content, size_mb)
                 FILE_CACHE_CURRENT_SIZE += size_mb
 
         return True
@@ -478,18 +576,24 @@ async def verify_file(
     filepath: Union[str, Path], max_attempts: int = 10, delay: int = 1
 ) -> bool:
     """Überprüft asynchron die Existenz und Integrität einer Datei mit Cache-Unterstützung"""
-    path = Path(filepath)
+    path = os.fspath(filepath)
 
-    # Prüfe zuerst den Cache
-    if str(path) in FILE_CACHE:
+    # Prüfe zuerst den Cache (Treffer als zuletzt genutzt markieren)
+    if path in FILE_CACHE:
+        FILE_CACHE.move_to_end(path)
         return True
 
     # Verbesserungsvorschlag #2: Semaphore für begrenzte Parallelität
     async with IO_SEMAPHORE:
         for _ in range(max_attempts):
-            if path.exists() and path.stat().st_size > 0:
+            # Ein einziger stat()-Aufruf statt exists() + zweimal stat()
+            try:
+                size = os.stat(path).st_size
+            except OSError:
+                size = 0
+            if size > 0:
                 # Ggf. Datei cachen für zukünftige Zugriffe
-                if path.stat().st_size < 10 * 1024 * 1024:  # Nur Dateien < 10MB cachen
+                if size < 10 * 1024 * 1024:  # Nur Dateien < 10MB cachen
                     await cache_file(path)
                 return True
             await asyncio.sleep(delay)
@@ -511,7 +615,8 @@ def make_hashable(obj: Any) -> Any:
     """Konvertiert unhashbare Python-Objekte in hashbare Äquivalente"""
     if isinstance(obj, dict):
         return frozenset((k, make_hashable(v)) for k, v in obj.items())
-    elif isinstance(obj, list):
+    elif isinstance(obj, (list, tuple)):
+        # Tupel ebenfalls rekursiv: (args, kwargs) enthält ein dict
         return tuple(make_hashable(i) for i in obj)
     elif isinstance(obj, set):
         return frozenset(make_hashable(i) for i in obj)
@@ -519,6 +624,23 @@ def make_hashable(obj: Any) -> Any:
         return obj
 
 
+def make_cache_key(obj: Any) -> Any:
+    """Erzeugt einen Cache-Schlüssel: serialisierte Bytes via orjson, sonst make_hashable"""
+    if not HAS_ORJSON:
+        return make_hashable(obj)
+    try:
+        # Ohne OPT_NON_STR_KEYS: 1 und "1" als Schlüssel würden sonst identisch serialisiert
+        data = orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        # z.B. Sets, Nicht-String-Schlüssel oder eigene Objekte
+        return make_hashable(obj)
+    if HAS_XXHASH:
+        # 128-Bit-Digest statt der vollen Bytes: große Info-Dicts belegen im
+        # Cache nur noch einen kleinen int, Kollisionen sind praktisch ausgeschlossen
+        return xxhash.xxh3_128_intdigest(data)
+    return data
+
+
 # Implementierung eines verbesserten dict-sicheren lru_cache
 def dict_safe_lru_cache(maxsize=128, typed=False):
     """Eine verbesserte Variante von lru_cache, die mit Dictionaries umgehen kann."""
@@ -573,30 +695,12 @@ def dict_safe_lru_cache(maxsize=128, typed=False):
 @string_cache.decorator
 def fix_artist_from_title_if_needed(artist: str, title: str) -> str:
     """Extrahiert den Artist aus dem Titel, wenn nötig"""
-    from config import Config
-
-    # Implementierung von Verbesserungsvorschlag #6: Lokale Zwischenspeicherung
-    bad_artists = getattr(Config, "_bad_artists_cache", None)
-    if bad_artists is None:
-        bad_artists = frozenset(
-            a.lower()
-            for a in Config.ORGANIZER_CONFIG.get("replace_artist_from_title_if", [])
-        )
-        # Cache im Config-Objekt speichern
-        setattr(Config, "_bad_artists_cache", bad_artists)
-
     if not artist or not title:
         return artist
 
-    if artist.lower() not in bad_artists:
+    if artist.lower() not in _BAD_ARTISTS:
         return artist
 
-    # Optimiertes Pattern-Matching mit kompiliertem Pattern
-    ARTIST_TITLE_PATTERN = getattr(fix_artist_from_title_if_needed, "_pattern", None)
-    if ARTIST_TITLE_PATTERN is None:
-        ARTIST_TITLE_PATTERN = re.compile(r"(?P<artist>.+?)\s*[-–]\s*(?P<title>.+)")
-        setattr(fix_artist_from_title_if_needed, "_pattern", ARTIST_TITLE_PATTERN)
-
     match = ARTIST_TITLE_PATTERN.match(title)
     if match:
         extracted = match.group("artist").strip()
@@ -615,7 +719,11 @@ def extract_featured_artist(title: str) -> Tuple[str, Optional[str]]:
     if not title or len(title) < 5:  # Kurze Strings überspringen
         return title, None
 
-    # Verwende die vorcompilierten Patterns
+    # Ein Scan für den häufigen Fall ohne Feature
+    if not FEAT_PREFILTER_PATTERN.search(title):
+        return title, None
+
+    # Verwende die vorcompilierten Patterns (Reihenfolge = Priorität)
     for pattern in FEAT_PATTERNS:
         match = pattern.search(title)
         if match:
@@ -635,11 +743,11 @@ def clean_artist_name(artist_string: str) -> str:
     if not artist_string:
         return "Various Artists"
 
-    # Schritt 1: Nur den Teil vor einem Titel-Trenner wie " - ", "–", "—"
-    artist_string = re.split(r"\s*[-–—]\s*", artist_string)[0]
-
-    # Schritt 2: Trennen bei typischen Multi-Artist-Konstruktionen und ersten Eintrag nehmen
-    artist_string = re.split(r",|&|feat\.|ft\.|with", artist_string, flags=re.IGNORECASE)[0]
+    # Schritt 1+2: Nur den Teil vor dem ersten Titel-Trenner (" - ", "–", "—")
+    # bzw. vor typischen Multi-Artist-Konstruktionen behalten - ein Scan
+    match = FIRST_ARTIST_END_PATTERN.search(artist_string)
+    if match:
+        artist_string = artist_string[: match.start()]
 
     # Schritt 3: Anwenden des vorcompilierten Cleanups (wie bisher)
     artist = ARTIST_CLEANUP_PATTERN.sub("", artist_string)
@@ -651,22 +759,13 @@ def clean_artist_name(artist_string: str) -> str:
 @string_cache.decorator
 def extract_main_artist(artist: str) -> str:
     """Extrahiert den Hauptkünstler aus einem String"""
-    from config import ARTIST_NAME_OVERRIDES
-
-    # Lokale Zwischenspeicherung von häufig verwendeten Werten - Verbesserungsvorschlag #6
-    overrides_lowercase = getattr(extract_main_artist, "_overrides_lowercase", None)
-    if overrides_lowercase is None:
-        overrides_lowercase = {k.lower(): v for k, v in ARTIST_NAME_OVERRIDES.items()}
-        setattr(extract_main_artist, "_overrides_lowercase", overrides_lowercase)
-
     # String-Builder Pattern: Nutze split mit maxsplit=1 direkt
     raw = ARTIST_SPLIT_PATTERN.split(artist, maxsplit=1)[0].strip()
 
     # Optimierter Lookup mit vorberechneten Lowercase-Keys
-    return overrides_lowercase.get(raw.lower(), raw)
+    return _ARTIST_OVERRIDES_LC.get(raw.lower(), raw)
 
 
-@lfu_cache.decorator
 def identify_album_from_video(info: Dict[str, Any]) -> Optional[str]:
     """
     Versucht, den Albumnamen aus den Videoinformationen zu extrahieren mit LFU Cache.
@@ -675,10 +774,16 @@ def identify_album_from_video(info: Dict[str, Any]) -> Optional[str]:
     info_title = info.get("title", "")
     info_description = info.get("description", "")
 
-    # Early-Return für leere Strings
+    # Early-Return für leere Strings - ohne Schlüsselbildung über das ganze Info-Dict
     if not info_title and not info_description:
         return None
 
+    return _identify_album_cached(info_title, info_description)
+
+
+@lfu_cache.decorator
+def _identify_album_cached(info_title: str, info_description: str) -> Optional[str]:
+    """Gecachter Kern von identify_album_from_video, Schlüssel sind nur Titel und Beschreibung"""
     possible_fields = [info_title, info_description]
 
     # Verwende vorkompilierte Patterns
@@ -697,13 +802,15 @@ def identify_album_from_video(info: Dict[str, Any]) -> Optional[str]:
 
 from metadata import process_metadata, write_metadata
 
+# Übersetzungstabelle für Telegram MarkdownV2 (einmalig beim Import erstellt)
+_MDV2_TABLE = str.maketrans({c: "\\" + c for c in "_*[]()~`>#+-=|{}.!"})
+
 
 class MetadataManager:
     # Statische Cache für häufig verwendete Metadaten - Verbesserungsvorschlag #6
     _metadata_cache = {}
     _cache_hits = 0
     _cache_misses = 0
-    _cache_lock = asyncio.Lock()
     _MAX_CACHE_SIZE = 500
 
     @staticmethod
@@ -725,7 +832,7 @@ class MetadataManager:
         original_title = title  # Zurückbehalten für Log oder Fallback
 
         # 1. Klammerzusätze wie (Remix), (Official Video) etc. entfernen
-        title = re.sub(r"\s*\(.*?\)", "", title).strip()
+        title = PAREN_SUFFIX_PATTERN.sub("", title).strip()
 
         title_lower = title.lower()
         artist_lower = artist.lower().strip()
@@ -736,12 +843,15 @@ class MetadataManager:
 
         # 3. Entferne alle Teile, die dem Artist entsprechen (z. B. 'Kygo, HAYLA' → 'Without You')
         title_parts = title.split(' - ')
-        artist_parts = [part.strip().lower() for part in re.split(r",|&|feat\.|ft\.|with", artist_lower)]
-
-        cleaned_parts = []
-        for part in title_parts:
-            if not any(artist in part.lower() for artist in artist_parts):
-                cleaned_parts.append(part.strip())
+        # artist_lower ist bereits kleingeschrieben, ein weiteres lower() ist überflüssig
+        artist_parts = [part.strip() for part in TITLE_ARTIST_SPLIT_PATTERN.split(artist_lower)]
+
+        # Jeden Titelteil nur einmal kleinschreiben statt einmal pro Artist-Teil
+        cleaned_parts = [
+            part.strip()
+            for part, part_lower in zip(title_parts, [p.lower() for p in title_parts])
+            if not any(a in part_lower for a in artist_parts)
+        ]
 
         cleaned_title = " - ".join(cleaned_parts).strip()
 
@@ -752,11 +862,7 @@ class MetadataManager:
         """Escaped spezielle Zeichen für Telegram MarkdownV2"""
         if not text:
             return ""
-        text = str(text)
-        reserved_chars = ['_', '*', '[', ']', '(', ')', '~', '`', '>', '#', '+', '-', '=', '|', '{', '}', '.', '!']
-        for char in reserved_chars:
-            text = text.replace(char, f'\\{char}')
-        return text
+        return str(text).translate(_MDV2_TABLE)
 
     @classmethod
     async def get_cache_stats(cls):
@@ -785,31 +891,29 @@ class MetadataManager:
     async def enrich_metadata(cls, info: dict) -> dict:
         """Verbesserte enrich_metadata mit intelligentem Caching und LFU-Strategie"""
         # Erstelle einen hashbaren Schlüssel für das Dictionary
-        cache_key = make_hashable(info)
+        cache_key = make_cache_key(info)
 
-        # Prüfe zuerst den Cache
-        async with cls._cache_lock:
-            if cache_key in cls._metadata_cache:
-                cls._cache_hits += 1
-                return cls._metadata_cache[cache_key]
-            cls._cache_misses += 1
+        # Prüfe zuerst den Cache. Kein Lock nötig: zwischen den Dict-Zugriffen
+        # liegt kein await, auf dem Event-Loop laufen sie daher ununterbrochen.
+        cache = cls._metadata_cache
+        if cache_key in cache:
+            cls._cache_hits += 1
+            return cache[cache_key]
+        cls._cache_misses += 1
 
         # Cache Miss: Führe die Verarbeitung durch
         result = await cls.process(info)
 
-        # Aktualisiere den Cache mit LFU-Strategie
-        async with cls._cache_lock:
-            # Cache-Bereinigung, wenn Maximalgröße erreicht ist
-            if len(cls._metadata_cache) >= cls._MAX_CACHE_SIZE:
-                # Entferne 10% der am wenigsten verwendeten Einträge
-                items_to_remove = int(cls._MAX_CACHE_SIZE * 0.1)
-                if items_to_remove > 0:
-                    for _ in range(items_to_remove):
-                        if cls._metadata_cache:
-                            cls._metadata_cache.pop(next(iter(cls._metadata_cache)))
+        # Cache-Bereinigung, wenn Maximalgröße erreicht ist
+        if len(cache) >= cls._MAX_CACHE_SIZE:
+            # Entferne die ältesten 10% der Einträge
+            for _ in range(int(cls._MAX_CACHE_SIZE * 0.1)):
+                if not cache:
+                    break
+                cache.pop(next(iter(cache)))
 
-            # Füge neuen Eintrag hinzu
-            cls._metadata_cache[cache_key] = result
+        # Füge neuen Eintrag hinzu
+        cache[cache_key] = result
 
         return result
 
@@ -826,10 +930,6 @@ class MetadataManager:
             chunk_results = await asyncio.gather(*tasks)
             results.extend(chunk_results)
 
-            # Kurze Pause zwischen Chunks
-            if i + chunk_size < len(info_list):
-                await asyncio.sleep(0.1)
-
         return results
 
     @classmethod
@@ -851,10 +951,6 @@ class MetadataManager:
             ]
             results.extend(processed_results)
 
-            # Kurze Pause zwischen Chunks
-            if i + chunk_size < len(operations):
-                await asyncio.sleep(0.1)
-
         return results
 
 
@@ -892,52 +988,115 @@ class AudioMetadata:
 
 
 # Thumbnail Caching für write_metadata - Verbesserungsvorschlag #4
-THUMBNAIL_CACHE = {}
+THUMBNAIL_CACHE: "OrderedDict[str, bytes]" = OrderedDict()  # LRU: ältester Eintrag vorne
 THUMBNAIL_CACHE_MAX_SIZE = 20 * 1024 * 1024  # 20 MB
 THUMBNAIL_CACHE_CURRENT_SIZE = 0
 THUMBNAIL_CACHE_LOCK = asyncio.Lock()
+# Laufende Downloads je URL, damit gleichzeitige Anfragen nur einmal laden
+_THUMB_INFLIGHT: Dict[str, asyncio.Future] = {}
+# Kürzlich fehlgeschlagene URLs (404, Timeout, ...) mit Zeitpunkt des Fehlers
+_THUMB_NEG_CACHE: "OrderedDict[str, float]" = OrderedDict()
+_THUMB_NEG_CACHE_MAX_SIZE = 512
+_THUMB_NEG_CACHE_TTL = 600  # Sekunden
+
+# Gemeinsame HTTP-Session für Thumbnails (Keep-Alive und DNS-Cache über Aufrufe hinweg).
+# Die Session gehört zu dem Event-Loop, in dem sie angelegt wurde.
+_THUMB_SESSION: Optional[aiohttp.ClientSession] = None
+_THUMB_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_thumb_session() -> aiohttp.ClientSession:
+    """Liefert die Thumbnail-Session des laufenden Event-Loops und legt sie bei Bedarf an"""
+    global _THUMB_SESSION, _THUMB_SESSION_LOOP
+    loop = asyncio.get_running_loop()
+    # Kein Lock nötig: zwischen Prüfung und Anlegen liegt kein await
+    # Eine Session aus einem anderen (evtl. beendeten) Loop ist hier nicht nutzbar
+    if _THUMB_SESSION is None or _THUMB_SESSION.closed or _THUMB_SESSION_LOOP is not loop:
+        connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+        _THUMB_SESSION = aiohttp.ClientSession(connector=connector)
+        _THUMB_SESSION_LOOP = loop
+    return _THUMB_SESSION
+
+
+async def close_thumb_session() -> None:
+    """Schließt die gemeinsame Thumbnail-Session (beim Herunterfahren aufrufen)"""
+    global _THUMB_SESSION, _THUMB_SESSION_LOOP
+    if _THUMB_SESSION is not None and not _THUMB_SESSION.closed:
+        await _THUMB_SESSION.close()
+    _THUMB_SESSION = None
+    _THUMB_SESSION_LOOP = None
 
 
 async def cache_thumbnail(url: str) -> Optional[bytes]:
     """Lädt ein Thumbnail und cached es"""
-    global THUMBNAIL_CACHE_CURRENT_SIZE
-
-    # Prüfe zuerst den Cache
+    # Prüfe zuerst den Cache (Treffer als zuletzt genutzt markieren)
     if url in THUMBNAIL_CACHE:
+        THUMBNAIL_CACHE.move_to_end(url)
         return THUMBNAIL_CACHE[url]
 
+    # Kürzlich fehlgeschlagene URLs nicht erneut anfragen
+    failed_at = _THUMB_NEG_CACHE.get(url)
+    if failed_at is not None:
+        if time.monotonic() - failed_at < _THUMB_NEG_CACHE_TTL:
+            return None
+        del _THUMB_NEG_CACHE[url]
+
+    # Läuft bereits ein Download für diese URL (z.B. gleiches Album-Cover),
+    # auf dessen Ergebnis warten statt erneut zu laden
+    pending = _THUMB_INFLIGHT.get(url)
+    if pending is not None:
+        return await asyncio.shield(pending)
+
+    future = asyncio.get_running_loop().create_future()
+    _THUMB_INFLIGHT[url] = future
+    content = None
+    try:
+        content = await _download_thumbnail(url)
+        return content
+    finally:
+        del _THUMB_INFLIGHT[url]
+        future.set_result(content)
+
+
+async def _download_thumbnail(url: str) -> Optional[bytes]:
+    """Lädt ein Thumbnail über die gemeinsame Session und legt es im Cache ab"""
+    global THUMBNAIL_CACHE_CURRENT_SIZE
+
     try:
-        import aiohttp
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=10) as response:
-                if response.status == 200:
-                    content = await response.read()
-
-                    # Cache das Thumbnail
-                    async with THUMBNAIL_CACHE_LOCK:
-                        # Cache bereinigen, wenn er zu groß wird
-                        if (
-                            THUMBNAIL_CACHE_CURRENT_SIZE + len(content)
-                            > THUMBNAIL_CACHE_MAX_SIZE
+        session = _get_thumb_session()
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status == 200:
+                content = await response.read()
+
+                # Cache das Thumbnail
+                async with THUMBNAIL_CACHE_LOCK:
+                    # Cache bereinigen, wenn er zu groß wird
+                    if (
+                        THUMBNAIL_CACHE_CURRENT_SIZE + len(content)
+                        > THUMBNAIL_CACHE_MAX_SIZE
+                    ):
+                        # Entferne die am längsten nicht genutzten Einträge
+                        while (
+                            THUMBNAIL_CACHE
+                            and THUMBNAIL_CACHE_CURRENT_SIZE + len(content)
+                            > THUMBNAIL_CACHE_MAX_SIZE * 0.8
                         ):
-                            # Entferne älteste Einträge
-                            while (
-                                THUMBNAIL_CACHE
-                                and THUMBNAIL_CACHE_CURRENT_SIZE + len(content)
-                                > THUMBNAIL_CACHE_MAX_SIZE * 0.8
-                            ):
-                                _, oldest_content = THUMBNAIL_CACHE.popitem()
-                                THUMBNAIL_CACHE_CURRENT_SIZE -= len(oldest_content)
-
-                        # Neues Thumbnail cachen
-                        THUMBNAIL_CACHE[url] = content
-                        THUMBNAIL_CACHE_CURRENT_SIZE += len(content)
-
-                    return content
+                            _, oldest_content = THUMBNAIL_CACHE.popitem(last=False)
+                            THUMBNAIL_CACHE_CURRENT_SIZE -= len(oldest_content)
+
+                    # Neues Thumbnail cachen
+                    THUMBNAIL_CACHE[url] = content
+                    THUMBNAIL_CACHE_CURRENT_SIZE += len(content)
+
+                return content
     except Exception as e:
         logger.error(f"Thumbnail-Cache-Fehler: {e}")
 
+    # Fehlschlag merken, damit nachfolgende Aufrufe nicht erneut warten
+    _THUMB_NEG_CACHE[url] = time.monotonic()
+    _THUMB_NEG_CACHE.move_to_end(url)
+    if len(_THUMB_NEG_CACHE) > _THUMB_NEG_CACHE_MAX_SIZE:
+        _THUMB_NEG_CACHE.popitem(last=False)
     return None
 
 
@@ -946,36 +1105,24 @@ async def write_metadata_to_thread(
 ) -> bool:
     """
     Führt CPU-intensive Metadaten-Schreiboperationen in einem separaten Thread aus
-    Verbesserungsvorschlag #2: asyncio.to_thread für CPU-intensive Operationen
+    Verbesserungsvorschlag #2: eigener Thread-Pool für CPU-intensive Operationen
     """
-    loop = asyncio.get_event_loop()
+
+    # Pfad einmalig im Event-Loop umwandeln, nicht im Worker-Thread
+    src_str = os.fspath(src_path)
 
     # Definiere die CPU-intensive Operation
     def write_metadata_sync():
         try:
-            src_str = str(src_path)
-            dest_str = str(dest_path)
-
-            # Verbesserungsvorschlag #5: Lokale Config-Zwischenspeicherung
-            default_album = getattr(Config, "_default_album_cache", None)
-            if default_album is None:
-                default_album = Config.DEFAULT_ALBUM_NAME
-                setattr(Config, "_default_album_cache", default_album)
-
-            metadata_defaults = getattr(Config, "_metadata_defaults_cache", None)
-            if metadata_defaults is None:
-                metadata_defaults = Config.METADATA_DEFAULTS
-                setattr(Config, "_metadata_defaults_cache", metadata_defaults)
-
             audio = MP4(src_str)
 
             # Standard-Metadaten
             audio["\xa9nam"] = metadata["title"]
             audio["\xa9ART"] = metadata["artist"]
-            audio["\xa9alb"] = metadata.get("album", default_album)
+            audio["\xa9alb"] = metadata.get("album", _DEFAULT_ALBUM)
             audio["aART"] = metadata.get("album_artist", metadata["artist"])
             audio["\xa9day"] = str(metadata.get("year", datetime.now().year))
-            audio["\xa9gen"] = metadata.get("genre", metadata_defaults["genre"])
+            audio["\xa9gen"] = metadata.get("genre", _METADATA_DEFAULTS["genre"])
             audio["trkn"] = [(metadata.get("track_number", 1), 0)]
 
             # Cover Art aus dem Cache
@@ -994,7 +1141,8 @@ async def write_metadata_to_thread(
 
     # Führe die Operation in einem Thread aus
     try:
-        return await loop.run_in_executor(None, write_metadata_sync)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(METADATA_EXECUTOR, write_metadata_sync)
     except Exception as e:
         logger.error(f"Thread-Ausführungsfehler: {e}")
         return False
@@ -1007,10 +1155,6 @@ async def write_metadata(
     src_str = str(src_path)
     dest_str = str(dest_path)
 
-    # Verbesserungsvorschlag #5: Lokale Config-Zwischenspeicherung
-    default_album = Config.DEFAULT_ALBUM_NAME
-    metadata_defaults = Config.METADATA_DEFAULTS
-
     # Thumbnail im Voraus laden und cachen, falls vorhanden
     if "thumbnail" in metadata and isinstance(metadata["thumbnail"], str):
         thumbnail_data = await cache_thumbnail(metadata["thumbnail"])
@@ -1069,11 +1213,115 @@ class FileMetadata:
         )
 
 
+def _extract_metadata_sync(
+    file_path: str, default_year: str
+) -> Tuple[Dict[str, Any], Optional[Tuple[str, int]]]:
+    """
+    Synchrone Metadaten-Extraktion für Thread- und Prozess-Pool.
+    Modulweit statt als Methode, damit sie für den ProcessPoolExecutor picklebar ist.
+    Liefert die Metadaten und den (album_key, jahr)-Eintrag für temp_year_storage.
+    """
+    try:
+        metadata = mutagen.File(file_path)
+        if not metadata:
+            return {}, None
+
+        # Verbesserungsvorschlag #5: Lokale Zwischenspeicherung der Tag-Mappings
+        if isinstance(metadata, MP4):
+            tags = {
+                "artist": "\xa9ART",
+                "album_artist": "aART",
+                "title": "\xa9nam",
+                "album": "\xa9alb",
+                "year": "\xa9day",
+                "track": "trkn",
+            }
+        else:
+            tags = {
+                "artist": "artist",
+                "album_artist": "albumartist",
+                "title": "title",
+                "album": "album",
+                "year": "date",
+                "track": "tracknumber",
+            }
+
+        # Erster Wert je Tag, fehlende oder leere Tags werden None -
+        # ohne try/except-Aufbau pro Tag
+        result: Dict[str, Any] = {
+            key: str(values[0]) if (values := metadata.get(tag)) and values[0] else None
+            for key, tag in tags.items()
+        }
+
+        # Verbesserungsvorschlag #5: Lokale Konstanten
+        unknown_artist = "Unknown Artist"
+        singles_album = "Singles"
+
+        defaults = {
+            "artist": unknown_artist,
+            "album_artist": result.get("artist"),
+            "title": os.path.splitext(os.path.basename(file_path))[0],
+            "album": singles_album,
+            "year": default_year,
+            "track": 1,
+        }
+
+        for key in defaults:
+            result[key] = result.get(key) or defaults[key]
+
+        first_artist = extract_main_artist(result["artist"])
+        album = sanitize_filename(result["album"])
+        album_key = f"{first_artist}::{album}"
+
+        year_raw = result.get("year")
+        try:
+            year = int(year_raw)
+        except (TypeError, ValueError):
+            year = datetime.now().year
+
+        # Verbesserungsvorschlag #4: Optimierung der Regex-Nutzung
+        try:
+            track_raw = (
+                metadata.get("trkn")
+                if isinstance(metadata, MP4)
+                else result["track"]
+            )
+
+            if isinstance(track_raw, list) and isinstance(track_raw[0], tuple):
+                result["track"] = track_raw[0][0]
+            elif isinstance(track_raw, tuple):
+                result["track"] = track_raw[0]
+            else:
+                # Verwende das kompilierte Pattern für bessere Performance
+                track_match = TRACK_NUMBER_PATTERN.search(str(track_raw))
+                result["track"] = int(track_match.group(1)) if track_match else 1
+        except:
+            result["track"] = 1
+
+        return result, (album_key, year)
+
+    # Verbesserungsvorschlag #7: Spezifische Exception-Typen
+    except MutagenError as e:
+        log_error(
+            f"Metadaten-Extraktionsfehler (Mutagen): {e}", {"file": file_path}
+        )
+        return {}, None
+    except (KeyError, ValueError) as e:
+        log_error(f"Fehlerhafte Metadaten: {e}", {"file": file_path})
+        return {}, None
+    except Exception as e:
+        log_error(
+            f"Unerwarteter Fehler bei Metadaten: {e}", {"file": file_path}
+        )
+        return {}, None
+
+
 class FilenameFixerTool:
     # Verbesserungsvorschlag #8: Statische Variablen
     _DEFAULT_YEAR = str(datetime.now().year)
     _VALID_EXTENSIONS = frozenset([".m4a", ".mp3", ".flac"])
     _BATCH_SIZE = 50
+    _PROCESS_POOL_THRESHOLD = 200
 
     def __init__(
         self,
@@ -1091,9 +1339,15 @@ class FilenameFixerTool:
         self.fail_dir = Path(fail_dir if fail_dir else fail_default)
         self.fail_dir.mkdir(exist_ok=True, parents=True)
 
+        # Bereits angelegte Zielverzeichnisse - mkdir nur einmal pro Verzeichnis
+        self._ensured_dirs: Set[Path] = {self.fail_dir}
+        # Bekannte Dateinamen je Zielverzeichnis (einmal per scandir gelesen)
+        self._dir_name_cache: Dict[Path, Set[str]] = {}
+
         # Datenstrukturen für Album-Jahre
         self.album_year_map = {}
-        self.temp_year_storage = {}
+        # Frühestes gültiges Jahr je Album (None, solange keins gefunden wurde)
+        self.temp_year_storage: Dict[str, Optional[int]] = {}
 
         # Statistiken
         self.stats = {
@@ -1106,6 +1360,11 @@ class FilenameFixerTool:
 
         # Implementierung von Verbesserungsvorschlag #5: Memoization für Config-Zugriffe
         self.organizer_config = Config.ORGANIZER_CONFIG
+        # Titelregeln einmalig kompilieren statt pro Datei über re.sub
+        self._compiled_rules = [
+            (re.compile(pattern, re.IGNORECASE), repl)
+            for pattern, repl in self.organizer_config.get("filename_rules", {}).items()
+        ]
         self.default_year = getattr(
             Config, "DEFAULT_YEAR", FilenameFixerTool._DEFAULT_YEAR
         )
@@ -1113,121 +1372,32 @@ class FilenameFixerTool:
         # Semaphore für begrenzte Parallelität - Verbesserungsvorschlag #2
         self.concurrency_limit = asyncio.Semaphore(30)
 
-    async def _get_metadata(self, file_path: Path) -> Dict[str, Any]:
-        """CPU-intensive Metadaten-Extraktion in separatem Thread"""
-        loop = asyncio.get_event_loop()
+        # configure_logging richtet Handler nur einmal ein
+        self._logging_configured = False
 
+    async def _get_metadata(
+        self, file_path: Path, executor: Executor = METADATA_EXECUTOR
+    ) -> Dict[str, Any]:
+        """CPU-intensive Metadaten-Extraktion in separatem Thread oder Prozess"""
         try:
-            # Führe die Metadaten-Extraktion in einem Thread aus
-            return await loop.run_in_executor(
-                None, self._extract_metadata_sync, file_path
+            # Führe die Metadaten-Extraktion im Pool aus
+            loop = asyncio.get_running_loop()
+            result, year_entry = await loop.run_in_executor(
+                executor, _extract_metadata_sync, str(file_path), self.default_year
             )
         except Exception as e:
             logger.error(f"Fehler bei der Metadatenextraktion: {e}")
             return {}
 
-    def _extract_metadata_sync(self, file_path: Path) -> Dict[str, Any]:
-        """Synchrone Metadaten-Extraktion für Threading"""
-        try:
-            metadata = mutagen.File(file_path)
-            if not metadata:
-                return {}
-
-            result: Dict[str, Any] = {}
-
-            # Verbesserungsvorschlag #5: Lokale Zwischenspeicherung der Tag-Mappings
-            if isinstance(metadata, MP4):
-                tags = {
-                    "artist": "\xa9ART",
-                    "album_artist": "aART",
-                    "title": "\xa9nam",
-                    "album": "\xa9alb",
-                    "year": "\xa9day",
-                    "track": "trkn",
-                }
-            else:
-                tags = {
-                    "artist": "artist",
-                    "album_artist": "albumartist",
-                    "title": "title",
-                    "album": "album",
-                    "year": "date",
-                    "track": "tracknumber",
-                }
-
-            for key, tag in tags.items():
-                try:
-                    value = metadata[tag][0] if tag in metadata else None
-                    result[key] = str(value) if value else None
-                except:
-                    result[key] = None
-
-            # Verbesserungsvorschlag #5: Lokale Konstanten
-            unknown_artist = "Unknown Artist"
-            singles_album = "Singles"
-
-            defaults = {
-                "artist": unknown_artist,
-                "album_artist": result.get("artist"),
-                "title": file_path.stem,
-                "album": singles_album,
-                "year": self.default_year,
-                "track": 1,
-            }
-
-            for key in defaults:
-                result[key] = result.get(key) or defaults[key]
-
-            first_artist = extract_main_artist(result["artist"])
-            album = sanitize_filename(result["album"])
-            album_key = f"{first_artist}::{album}"
-
-            year_raw = result.get("year")
-            try:
-                year = int(year_raw)
-            except (TypeError, ValueError):
-                year = datetime.now().year
-
-            if album_key not in self.temp_year_storage:
-                self.temp_year_storage[album_key] = []
-
-            self.temp_year_storage[album_key].append(year)
-
-            # Verbesserungsvorschlag #4: Optimierung der Regex-Nutzung
-            try:
-                track_raw = (
-                    metadata.get("trkn")
-                    if isinstance(metadata, MP4)
-                    else result["track"]
-                )
-
-                if isinstance(track_raw, list) and isinstance(track_raw[0], tuple):
-                    result["track"] = track_raw[0][0]
-                elif isinstance(track_raw, tuple):
-                    result["track"] = track_raw[0]
-                else:
-                    # Verwende das kompilierte Pattern für bessere Performance
-                    track_match = TRACK_NUMBER_PATTERN.search(str(track_raw))
-                    result["track"] = int(track_match.group(1)) if track_match else 1
-            except:
-                result["track"] = 1
-
-            return result
-
-        # Verbesserungsvorschlag #7: Spezifische Exception-Typen
-        except MutagenError as e:
-            log_error(
-                f"Metadaten-Extraktionsfehler (Mutagen): {e}", {"file": str(file_path)}
-            )
-            return {}
-        except (KeyError, ValueError) as e:
-            log_error(f"Fehlerhafte Metadaten: {e}", {"file": str(file_path)})
-            return {}
-        except Exception as e:
-            log_error(
-                f"Unerwarteter Fehler bei Metadaten: {e}", {"file": str(file_path)}
-            )
-            return {}
+        # Album-Jahre im Hauptprozess laufend auf das früheste gültige Jahr reduzieren
+        if year_entry is not None:
+            album_key, year = year_entry
+            current = self.temp_year_storage.get(album_key)
+            if 1900 <= year <= datetime.now().year and (current is None or year < current):
+                self.temp_year_storage[album_key] = year
+            elif album_key not in self.temp_year_storage:
+                self.temp_year_storage[album_key] = None
+        return result
 
     # Implementierung von Verbesserungsvorschlag #4: Batch-Verarbeitung für Metadaten
     async def _get_batch_metadata(
@@ -1238,21 +1408,30 @@ class FilenameFixerTool:
         chunk_size = 30
         results = {}
 
-        for i in range(0, len(file_paths), chunk_size):
-            chunk = file_paths[i : i + chunk_size]
-
-            # Verbesserungsvorschlag #2: Semaphore für begrenzte Parallelität
-            async with self.concurrency_limit:
-                tasks = [self._get_metadata(fp) for fp in chunk]
-                chunk_results = await asyncio.gather(*tasks)
-
-                # Ergebnisse zum Dictionary hinzufügen
-                for fp, meta in zip(chunk, chunk_results):
-                    results[fp] = meta
+        # Große Verzeichnisse über alle Kerne verteilen, kleine Mengen im Thread-Pool
+        # (der Prozessstart lohnt sich erst ab einer gewissen Dateianzahl)
+        process_pool = None
+        if len(file_paths) > FilenameFixerTool._PROCESS_POOL_THRESHOLD:
+            process_pool = _new_metadata_process_pool()
+        executor = process_pool or METADATA_EXECUTOR
 
-            # Kurze Pause zwischen Chunks
-            if i + chunk_size < len(file_paths):
-                await asyncio.sleep(0.1)
+        try:
+            for i in range(0, len(file_paths), chunk_size):
+                chunk = file_paths[i : i + chunk_size]
+
+                # Verbesserungsvorschlag #2: Semaphore für begrenzte Parallelität
+                async with self.concurrency_limit:
+                    tasks = [self._get_metadata(fp, executor) for fp in chunk]
+                    chunk_results = await asyncio.gather(*tasks)
+
+                    # Ergebnisse zum Dictionary hinzufügen
+                    for fp, meta in zip(chunk, chunk_results):
+                        results[fp] = meta
+        finally:
+            # Der Pool gehört nur diesem Batch: parallele Downloads teilen ihn nicht,
+            # und im Bot bleiben danach keine Worker-Prozesse zurück
+            if process_pool is not None:
+                process_pool.shutdown(wait=False, cancel_futures=True)
 
         return results
 
@@ -1262,16 +1441,14 @@ class FilenameFixerTool:
             self.stats["moved_to_fail"] += 1
             # Beschränke die Länge des Grundes
             reason_part = re.sub(r"[^\w\s-]", "_", reason[:20])
-            new_name = f"{file_path.stem}_ERROR_{reason_part}{file_path.suffix}"
-            target = self.fail_dir / new_name
+            base_name = f"{file_path.stem}_ERROR_{reason_part}"
+            suffix = file_path.suffix
+            target = self.fail_dir / f"{base_name}{suffix}"
             counter = 1
 
             # Finde einen eindeutigen Dateinamen
             while target.exists():
-                target = (
-                    self.fail_dir
-                    / f"{file_path.stem}_ERROR_{reason_part}_{counter}{file_path.suffix}"
-                )
+                target = self.fail_dir / f"{base_name}_{counter}{suffix}"
                 counter += 1
 
             await safe_rename(file_path, target)
@@ -1279,15 +1456,23 @@ class FilenameFixerTool:
         except Exception as e:
             log_error(f"Critical move error: {e}", {"file": str(file_path)})
 
-    async def fix_file(self, file_path: Path) -> bool:
-        """Korrigiert eine einzelne Datei mit Optimierungen"""
+    async def fix_file(
+        self, file_path: Path, metadata: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Korrigiert eine einzelne Datei mit Optimierungen.
+        Bereits per _get_batch_metadata gelesene Metadaten können übergeben werden.
+        """
         try:
             # Verbesserungsvorschlag #10: Logging statt Prints
             logger.debug(f"Starte fix_file für: {file_path}")
             self.stats["processed"] += 1
 
+            # Pfadbestandteile einmalig berechnen
+            extension = file_path.suffix
+
             # Early-Return für ungültige Dateiendungen - Verbesserungsvorschlag #7
-            if file_path.suffix.lower() not in FilenameFixerTool._VALID_EXTENSIONS:
+            if extension.lower() not in FilenameFixerTool._VALID_EXTENSIONS:
                 logger.debug("Ungültige Dateiendung – wird übersprungen.")
                 self.stats["skipped"] += 1
                 return False
@@ -1300,8 +1485,9 @@ class FilenameFixerTool:
                 await self._move_to_fail(file_path, "Invalid file")
                 return False
 
-            # Metadaten abrufen
-            metadata = await self._get_metadata(file_path)
+            # Metadaten abrufen, falls nicht schon im Batch gelesen
+            if metadata is None:
+                metadata = await self._get_metadata(file_path)
             logger.debug(f"Extrahierte Metadaten: {metadata}")
 
             if not metadata:
@@ -1318,11 +1504,12 @@ class FilenameFixerTool:
 
             # Implementierung von Verbesserungsvorschlag #6: Reduzierte String-Operationen
             # Einmalige Berechnung von sanitize_filename für artist_corrected
-            sanitized_artist_corrected = sanitize_filename(artist_corrected.strip())
+            artist_corrected = artist_corrected.strip()
+            sanitized_artist_corrected = sanitize_filename(artist_corrected)
 
             # Künstlernamen-Overrides verwenden
-            artist = ARTIST_NAME_OVERRIDES.get(
-                artist_corrected.strip(), sanitized_artist_corrected
+            artist = Config.ARTIST_NAME_OVERRIDES.get(
+                artist_corrected, sanitized_artist_corrected
             )
 
             # Einmalige Berechnung von sanitize_filename für album
@@ -1344,26 +1531,14 @@ class FilenameFixerTool:
             # Wir nutzen deine bestehende Funktion aus dem MetadataManager.
             title_cleaned = MetadataManager.clean_title(title_raw, artist)
             
-            # Regelbasierte Titelkorrektur (dieser Teil bleibt wie er ist)
-            rules = self.organizer_config.get("filename_rules", {})
-            for pattern, repl in rules.items():
-                title_cleaned = re.sub(
-                    pattern, repl, title_cleaned, flags=re.IGNORECASE
-                )
-            
-            # Regelbasierte Titelkorrektur
-            # Verwendung der zwischengespeicherten Config
-            rules = self.organizer_config.get("filename_rules", {})
-            for pattern, repl in rules.items():
-                title_cleaned = re.sub(
-                    pattern, repl, title_cleaned, flags=re.IGNORECASE
-                )
+            # Regelbasierte Titelkorrektur mit den vorkompilierten Regeln
+            for pattern, repl in self._compiled_rules:
+                title_cleaned = pattern.sub(repl, title_cleaned)
             
             # Leerzeichen normalisieren
-            title_cleaned = re.sub(r"\s+", " ", title_cleaned).strip()
+            title_cleaned = EXTRA_SPACES_PATTERN.sub(" ", title_cleaned).strip()
             title = sanitize_filename(title_cleaned)
             metadata["title"] = title
-            extension = file_path.suffix
             
             logger.debug(f"artist_raw: {artist_raw} → {artist}")
             logger.debug(f"title_raw: {title_raw} → {title}")
@@ -1383,22 +1558,39 @@ class FilenameFixerTool:
                 target_dir = self.library_dir / artist / year_album
                 filename = f"{track:02d} - {title}{extension}"
 
-            # Verzeichnis erstellen, falls es nicht existiert
-            target_dir.mkdir(parents=True, exist_ok=True)
+            # Verzeichnis erstellen, falls es in diesem Lauf noch nicht angelegt wurde
+            if target_dir not in self._ensured_dirs:
+                target_dir.mkdir(parents=True, exist_ok=True)
+                self._ensured_dirs.add(target_dir)
+            # Eindeutigen Dateinamen finden, falls bereits existiert - Kandidaten
+            # werden gegen die einmal eingelesenen Namen vorausgewählt
+            existing = self._dir_name_cache.get(target_dir)
+            if existing is None:
+                with os.scandir(target_dir) as entries:
+                    existing = {entry.name for entry in entries}
+                self._dir_name_cache[target_dir] = existing
+            # Die Liste kann veraltet sein (z.B. parallele Downloads mit eigener Instanz).
+            # os.replace überschreibt, daher den Kandidaten zusätzlich im Dateisystem prüfen
+            base = os.path.splitext(filename)[0]
+            counter = 0
+            while filename in existing or os.path.exists(target_dir / filename):
+                existing.add(filename)
+                counter += 1
+                filename = f"{base} ({counter}){extension}"
+            # Namen sofort reservieren, damit parallele fix_file-Aufrufe ihn nicht doppelt vergeben
+            existing.add(filename)
             target_path = target_dir / filename
 
-            # Eindeutigen Dateinamen finden, falls bereits existiert
-            if target_path.exists():
-                base = target_path.stem
-                counter = 1
-                while (target_dir / f"{base} ({counter}){extension}").exists():
-                    counter += 1
-                target_path = target_dir / f"{base} ({counter}){extension}"
-
             logger.debug(f"Zielpfad: {target_path}")
 
             # Umbenennen durchführen
-            await safe_rename(file_path, target_path)
+            renamed = False
+            try:
+                renamed = await safe_rename(file_path, target_path)
+            finally:
+                if not renamed:
+                    # Datei liegt nicht am Ziel: Namen wieder freigeben
+                    existing.discard(filename)
             self.stats["fixed"] += 1
             return True
 
@@ -1421,8 +1613,16 @@ class FilenameFixerTool:
         target_dir = directory or self.source_dir
         start_time = time.time()
 
-        # Alle Dateien sammeln
-        files = [f for f in target_dir.glob("*.*") if f.is_file()]
+        # Alle Audiodateien sammeln - scandir liefert is_file() ohne extra stat()
+        # und ungültige Endungen werden gar nicht erst eingeplant
+        with os.scandir(target_dir) as entries:
+            files = [
+                Path(entry.path)
+                for entry in entries
+                if os.path.splitext(entry.name)[1].lower()
+                in FilenameFixerTool._VALID_EXTENSIONS
+                and entry.is_file()
+            ]
         total_files = len(files)
 
         if not files:
@@ -1436,38 +1636,42 @@ class FilenameFixerTool:
         metadata_dict = await self._get_batch_metadata(files)
 
         # Jahre berechnen
-        for key, years in self.temp_year_storage.items():
-            # Verwende das früheste Jahr für jedes Album
-            valid_years = [
-                y
-                for y in years
-                if isinstance(y, int) and 1900 <= y <= datetime.now().year
-            ]
-            if valid_years:
-                self.album_year_map[key] = str(min(valid_years))
-            else:
-                self.album_year_map[key] = str(datetime.now().year)
-
-        # Dateien in Chunks verarbeiten für bessere Ressourcennutzung
-        logger.info("Verarbeite Dateien in Chunks...")
-        chunk_size = FilenameFixerTool._BATCH_SIZE
-        for i in range(0, len(files), chunk_size):
-            chunk = files[i : i + chunk_size]
-            # Verarbeite einen Chunk parallel
-            tasks = [self.fix_file(file_path) for file_path in chunk]
-            await asyncio.gather(*tasks)
-
-            # Status nach jedem Chunk ausgeben
-            processed_so_far = min(i + chunk_size, total_files)
-            elapsed = time.time() - start_time
-            files_per_second = processed_so_far / elapsed if elapsed > 0 else 0
-            logger.info(
-                f"Fortschritt: {processed_so_far}/{total_files} ({processed_so_far/total_files*100:.1f}%) - {files_per_second:.1f} Dateien/s"
+        # (das früheste Jahr je Album steht bereits in temp_year_storage)
+        current_year = str(datetime.now().year)
+        for key, year in self.temp_year_storage.items():
+            self.album_year_map[key] = str(year) if year is not None else current_year
+
+        # Nach Künstler und Album sortieren, damit gleiche Künstler in denselben
+        # Chunks landen und die LRU-Caches (sanitize_filename, extract_main_artist) treffen
+        files.sort(
+            key=lambda f: (
+                metadata_dict.get(f, {}).get("artist") or "",
+                metadata_dict.get(f, {}).get("album") or "",
             )
+        )
 
-            # Kurze Pause zwischen Chunks für andere Tasks
-            if i + chunk_size < len(files):
-                await asyncio.sleep(0.1)
+        # Alle Dateien einplanen; die Semaphore hält die Pipeline gefüllt, statt
+        # pro Chunk auf die langsamste Datei zu warten
+        logger.info("Verarbeite Dateien...")
+        tasks = [
+            asyncio.create_task(self._fix_file_limited(f, metadata_dict.get(f)))
+            for f in files
+        ]
+        processed_so_far = 0
+        for finished in asyncio.as_completed(tasks):
+            await finished
+            processed_so_far += 1
+
+            # Status alle _BATCH_SIZE Dateien ausgeben
+            if (
+                processed_so_far % FilenameFixerTool._BATCH_SIZE == 0
+                or processed_so_far == total_files
+            ):
+                elapsed = time.time() - start_time
+                files_per_second = processed_so_far / elapsed if elapsed > 0 else 0
+                logger.info(
+                    f"Fortschritt: {processed_so_far}/{total_files} ({processed_so_far/total_files*100:.1f}%) - {files_per_second:.1f} Dateien/s"
+                )
 
         # Abschließende Statistiken
         end_time = time.time()
@@ -1493,70 +1697,48 @@ class FilenameFixerTool:
         if not files:
             return {"processed": 0, "success": 0, "failed": 0}
 
-        # Dateien in Chunks aufteilen
-        chunks = [
-            files[i : i + FilenameFixerTool._BATCH_SIZE]
-            for i in range(0, len(files), FilenameFixerTool._BATCH_SIZE)
-        ]
         total_stats = {"processed": 0, "success": 0, "failed": 0}
 
-        for chunk in chunks:
-            # Metadaten für den Chunk sammeln
-            metadata_dict = await self._get_batch_metadata(chunk)
-
-            # Verarbeite alle Dateien im Chunk parallel
-            results = await asyncio.gather(*[self.fix_file(f) for f in chunk])
-
-            # Statistiken aktualisieren
-            total_stats["processed"] += len(chunk)
-            total_stats["success"] += sum(1 for r in results if r)
-            total_stats["failed"] += sum(1 for r in results if not r)
+        # Metadaten sammeln
+        metadata_dict = await self._get_batch_metadata(files)
 
-            # Kurze Pause zwischen Chunks
-            await asyncio.sleep(0.1)
+        # Alle Dateien über die Semaphore verarbeiten, Statistik laufend aktualisieren
+        tasks = [
+            asyncio.create_task(self._fix_file_limited(f, metadata_dict.get(f)))
+            for f in files
+        ]
+        for finished in asyncio.as_completed(tasks):
+            success = await finished
+            total_stats["processed"] += 1
+            total_stats["success" if success else "failed"] += 1
 
         return total_stats
 
+    async def _fix_file_limited(
+        self, file_path: Path, metadata: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """fix_file mit durch concurrency_limit begrenzter Parallelität"""
+        async with self.concurrency_limit:
+            return await self.fix_file(file_path, metadata)
+
     # Implementierung von Verbesserungsvorschlag #1: Verbesserte Caching-Strategie
     def optimize_cache_sizes(self) -> None:
         """
-        Passt die Cache-Größen basierend auf der verfügbaren Systemressourcen an
+        Meldet die beim Import anhand des verfügbaren RAMs gewählten Cache-Größen
         """
-        import psutil
-
-        try:
-            # Verfügbaren Arbeitsspeicher ermitteln
-            available_memory = psutil.virtual_memory().available
-
-            # Cache-Größen anpassen (in MB)
-            memory_threshold = 4 * 1024 * 1024 * 1024  # 4 GB
-
-            # Großer Cache bei genügend RAM
-            if available_memory > memory_threshold:
-                sanitize_filename.cache_clear()
-                extract_featured_artist.cache_clear()
-                clean_artist_name.cache_clear()
-                extract_main_artist.cache_clear()
-                # Caches mit neuen Größen erstellen
-                sanitize_filename.__wrapped__ = lru_cache(maxsize=8192)(
-                    sanitize_filename.__wrapped__
-                )
-                extract_featured_artist.__wrapped__ = lru_cache(maxsize=4096)(
-                    extract_featured_artist.__wrapped__
-                )
-                clean_artist_name.__wrapped__ = lru_cache(maxsize=4096)(
-                    clean_artist_name.__wrapped__
-                )
-                extract_main_artist.__wrapped__ = lru_cache(maxsize=4096)(
-                    extract_main_artist.__wrapped__
-                )
-
-            logger.info(
-                f"Cache-Größen optimiert basierend auf {available_memory/(1024*1024):.0f}MB verfügbarem RAM"
-            )
-
-        except Exception as e:
-            logger.warning(f"Cache-Optimierung fehlgeschlagen: {e}")
+        # Die Größen werden beim Import festgelegt (STRING_CACHE_SIZE); ein
+        # nachträgliches Umhängen von __wrapped__ hat die Aufrufer nie erreicht
+        logger.info(
+            f"Cache-Größe {STRING_CACHE_SIZE} basierend auf "
+            f"{AVAILABLE_MEMORY/(1024*1024):.0f}MB verfügbarem RAM"
+        )
+        for func in (
+            sanitize_filename,
+            extract_featured_artist,
+            clean_artist_name,
+            extract_main_artist,
+        ):
+            logger.info(f"{func.__name__}: {func.cache_info()}")
 
     # Implementierung von Verbesserungsvorschlag #4: String-Operationen optimieren
     def create_optimized_string_processors(self) -> None:
@@ -1565,8 +1747,6 @@ class FilenameFixerTool:
         """
         # Schon teilweise implementiert durch kompilierte RegEx-Patterns
         # Zusätzliche String-Interning für häufige Strings
-        from sys import intern
-
         # Häufige Strings als Konstanten definieren und intern() verwenden
         self._common_strings = {
             "unknown_artist": intern("Unknown Artist"),
@@ -1581,8 +1761,9 @@ class FilenameFixerTool:
     def configure_logging(
         self, log_level: int = logging.INFO, log_file: Optional[str] = None
     ) -> None:
-        """Konfiguriert das Logging mit strukturierten Logs"""
-        import json
+        """Konfiguriert das Logging mit strukturierten Logs (nur beim ersten Aufruf)"""
+        if self._logging_configured:
+            return
 
         # Basis-Logging-Konfiguration
         log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -1591,9 +1772,10 @@ class FilenameFixerTool:
         self._logger = logging.getLogger(f"{__name__}.FilenameFixerTool")
         self._logger.setLevel(log_level)
 
-        # Bestehende Handler entfernen
+        # Bestehende Handler entfernen (und Dateien schließen)
         for handler in self._logger.handlers[:]:
             self._logger.removeHandler(handler)
+            handler.close()
 
         # Console-Handler hinzufügen
         console_handler = logging.StreamHandler()
@@ -1606,25 +1788,13 @@ class FilenameFixerTool:
             file_handler.setFormatter(logging.Formatter(log_format))
             self._logger.addHandler(file_handler)
 
-        # JSON-Handler für strukturierte Logs
-        class JsonFormatter(logging.Formatter):
-            def format(self, record):
-                log_data = {
-                    "timestamp": self.formatTime(record),
-                    "level": record.levelname,
-                    "name": record.name,
-                    "message": record.getMessage(),
-                }
-                if hasattr(record, "data"):
-                    log_data["data"] = record.data
-                return json.dumps(log_data)
-
         # JSON-Datei-Handler hinzufügen wenn log_file angegeben
         if log_file:
             json_handler = logging.FileHandler(f"{log_file}.json")
             json_handler.setFormatter(JsonFormatter())
             self._logger.addHandler(json_handler)
 
+        self._logging_configured = True
         self._logger.info("Logging konfiguriert")
 
 
@@ -1633,12 +1803,6 @@ async def main():
     Hauptfunktion für die Kommandozeilenausführung.
     Verarbeitet Argumente und startet die Dateiorganisation.
     """
-    # Importiere notwendige Module
-    import argparse
-    import time
-    import asyncio
-    import logging
-
     # Argumentparser erstellen
     parser = argparse.ArgumentParser(description="Optimierter Music File Organizer")
     parser.add_argument("--source", help="Quellverzeichnis")
@@ -1692,11 +1856,11 @@ async def main():
 
     except Exception as e:
         logger.error(f"Kritischer Fehler: {e}")
-        import traceback
-
         logger.error(traceback.format_exc())
 
     finally:
+        await close_thumb_session()
+
         # Gesamtlaufzeit ausgeben
         elapsed = time.time() - start_time
         logger.info(f"Programm beendet. Gesamtlaufzeit: {elapsed:.2f} Sekunden")
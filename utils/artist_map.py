@@ -10,19 +10,23 @@ Dieses Skript enthält:
 """
 
 import re
+import sys
 import logging
+from functools import lru_cache
 import string
-from typing import Dict, List, Tuple
-
-# Logging-Konfiguration
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler()
-    ]
-)
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+# Optional: Aho-Corasick-Automat für die künstlerspezifischen Teilstring-Regeln
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# Das Logging konfiguriert die Anwendung; ohne Konfiguration bleibt das Modul still
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 # ---------- 1. EXPLIZITE KÜNSTLER-ÜBERSCHREIBUNGEN ----------
 RAW_OVERRIDES: Dict[str, str] = {
@@ -82,36 +86,59 @@ RAW_OVERRIDES: Dict[str, str] = {
     "w/": "with"
 }
 
-ARTIST_OVERRIDES: Dict[str, str] = {k.lower(): v for k, v in RAW_OVERRIDES.items()}
+# Schreibgeschützte Sicht, Schlüssel werden einmalig beim Import internalisiert.
+# Einträge ohne Ersatz (YouTube-Zusätze wie "vevo") sind keine Namen, sondern
+# werden über NOISE_PATTERN während der Bereinigung als ganze Wörter entfernt.
+ARTIST_OVERRIDES: Mapping[str, str] = MappingProxyType(
+    {sys.intern(k.lower()): v for k, v in RAW_OVERRIDES.items() if v}
+)
+NOISE_OVERRIDES: List[str] = sorted(
+    (k.lower() for k, v in RAW_OVERRIDES.items() if not v), key=len, reverse=True
+)
+NOISE_PATTERN = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, NOISE_OVERRIDES)) + r")\b"
+    # Kanalnamen wie "TaylorSwiftVEVO": nur das großgeschriebene Suffix
+    r"|(?<=\w)(?-i:VEVO)\b",
+    re.IGNORECASE
+)
 
 # ---------- 2. REGEX-REGELN ----------
-ARTIST_RULES: List[Tuple[str, str]] = [
-    # YouTube-spezifische Bereinigungen (zuerst anwenden)
-    (r"^(.+?)\s*-\s*.+", r"\1"),          # Alles nach " - " entfernen
+# Die Regeln sind nach ihrer Rolle in clean_artist_name gruppiert, jeder Abschnitt
+# wird als eigene Liste geführt. ARTIST_RULES enthält alle in Anwendungsreihenfolge.
+
+# YouTube-spezifische Bereinigungen (zuerst anwenden)
+SPLIT_RULE: Tuple[str, str] = (r"^(.+?)\s*-\s*.+", r"\1")  # Alles nach " - " entfernen
+REMOVAL_RULES: List[Tuple[str, str]] = [
     (r"\[.*?\]", ""),                      # [Klammern] entfernen
     (r"\(.*?\)", ""),                      # (Klammern) entfernen
-    (r"\bofficial\b", "", re.IGNORECASE),  # "official" entfernen
-    (r"\bvideo\b", "", re.IGNORECASE),     # "video" entfernen
+    (r"\bofficial\b", ""),                 # "official" entfernen
+    (r"\bvideo\b", ""),                    # "video" entfernen
     
-    # Feature- und Kollaborationsformate
-    (r"\s*\(feat\..*?\)", ""),            # (feat. ...)
-    (r"\s*\(ft\..*?\)", ""),              # (ft. ...)
+    # Feature-Formate; "(feat. ...)" und "(ft. ...)" erfasst bereits die Klammer-Regel
     (r"\s*featuring\s*.*", ""),           # featuring ...
+]
+
+# Kollaborationsformate
+COLLABORATION_RULES: List[Tuple[str, str]] = [
     (r"\s*[\+\&]\s*", ", "),              # + oder & → Komma
-    (r"\s*vs\.?\s*", ", "),               # vs oder vs. → Komma
-    (r"\s*x\s*", ", "),                   # x → Komma
-    (r"\s*with\s+", ", "),                # with → Komma
+    (r"\s*\bvs\b\.?\s*", ", "),           # vs oder vs. → Komma
+    (r"\s*\bx\b\s*", ", "),               # x → Komma
+    (r"\s*\bwith\s+", ", "),              # with → Komma
     (r"\s*\/\s*", ", "),                  # / → Komma
     (r"\s*;\s*", ", "),                   # ; → Komma
-    
-    # Allgemeine Bereinigungen
+]
+
+# Allgemeine Bereinigungen
+GENERAL_RULES: List[Tuple[str, str]] = [
     (r"\s*,\s*", ", "),                   # Kommas normalisieren
     (r"\s*-\s*", " "),                    # Bindestriche → Leerzeichen
     (r"\s*'\s*", "'"),                    # Apostrophe bereinigen
     (r"\s*\.\s*", "."),                   # Punkte bereinigen
     (r"^\s+|\s+$", ""),                   # Leerzeichen trimmen
     (r"\s+", " "),                        # Mehrfach-Leerzeichen
-    
+]
+
+ARTIST_SPECIFIC_RULES: List[Tuple[str, str]] = [
     # Spezifische Künstler-Regex (nützlich, wenn der Name Teil eines längeren Strings ist)
     # Deutschrap
     (r".*aggu.*", "Ski Aggu"),
@@ -135,25 +162,23 @@ ARTIST_RULES: List[Tuple[str, str]] = [
     (r".*montez.*", "MONTEZ"),
     (r".*kraftklub.*", "KRAFTKLUB"),
     (r".*ak\s*ausserkontrolle.*", "AK Ausserkontrolle"),
-	(r".*capital\s*bra.*", "Capital Bra"),
-	(r".*fler.*", "Fler"),
-	(r".*kollegah.*", "Kollegah"),
-	(r".*farid\s*bang.*", "Farid Bang"),
-	(r".*samra.*", "Samra"),
-	(r".*luciano.*", "Luciano"),
-	(r".*kontra\s*k.*", "Kontra K"),
-	(r".*summer\s*cem.*", "Summer Cem"),
-	(r".*majoe.*", "Majoe"),
-	(r".*joker\s*bra.*", "Joker Bra"),
-	(r".*kalim.*", "Kalim"),
-	(r".*reezy.*", "Reezy"),
-	(r".*kanye\s*west.*", "Kanye West"),
-	(r".*the\s*carters.*", "The Carters"),
-	(r".*jay\s*z.*", "Jay-Z"),
-	(r".*capital\s?bra.*", "Capital Bra"),  # Match mit/ohne Leerzeichen
-	(r".*kanye\s?west.*", "Kanye West"),
-	(r".*t\s?low.*", "T-Low")  # Für "T Low", "T-Low", "Tlow"
-	
+    (r".*capital\s*bra.*", "Capital Bra"),
+    (r".*fler.*", "Fler"),
+    (r".*kollegah.*", "Kollegah"),
+    (r".*farid\s*bang.*", "Farid Bang"),
+    (r".*samra.*", "Samra"),
+    (r".*luciano.*", "Luciano"),
+    (r".*kontra\s*k.*", "Kontra K"),
+    (r".*summer\s*cem.*", "Summer Cem"),
+    (r".*majoe.*", "Majoe"),
+    (r".*joker\s*bra.*", "Joker Bra"),
+    (r".*kalim.*", "Kalim"),
+    (r".*reezy.*", "Reezy"),
+    (r".*kanye\s*west.*", "Kanye West"),
+    (r".*the\s*carters.*", "The Carters"),
+    (r".*jay\s*z.*", "Jay-Z"),
+    (r".*t\s?low.*", "T-Low"),  # Für "T Low", "T-Low", "Tlow"
+
     # Pop / Andere
     (r".*bosse.*", "Bosse"),
     (r".*lea.*", "LEA"),
@@ -168,42 +193,136 @@ ARTIST_RULES: List[Tuple[str, str]] = [
     (r".*alle\s*farben.*", "Alle Farben"),
     (r".*benson\s*boone.*", "Benson Boone"),
     (r".*the\s*weeknd.*", "The Weeknd"),
-	(r".*post\s*malone.*", "Post Malone"),
-	(r".*ariana\s*grande.*", "Ariana Grande"),
-	(r".*taylor\s*swift.*", "Taylor Swift"),
-	(r".*ed\s*sheeran.*", "Ed Sheeran"),
-	(r".*billie\s*eilish.*", "Billie Eilish"),
-	(r".*doja\s*cat.*", "Doja Cat"),
-	(r".*david\s*guetta.*", "David Guetta"),
-	(r".*calvin\s*harris.*", "Calvin Harris"),
-	(r".*martin\s*garrix.*", "Martin Garrix"),
-	(r".*tiesto.*", "Tiësto"),
-	(r".*marshmello.*", "Marshmello"),
-	(r".*dualipa.*", "Dua Lipa"),
+    (r".*post\s*malone.*", "Post Malone"),
+    (r".*ariana\s*grande.*", "Ariana Grande"),
+    (r".*taylor\s*swift.*", "Taylor Swift"),
+    (r".*ed\s*sheeran.*", "Ed Sheeran"),
+    (r".*billie\s*eilish.*", "Billie Eilish"),
+    (r".*doja\s*cat.*", "Doja Cat"),
+    (r".*david\s*guetta.*", "David Guetta"),
+    (r".*calvin\s*harris.*", "Calvin Harris"),
+    (r".*martin\s*garrix.*", "Martin Garrix"),
+    (r".*tiesto.*", "Tiësto"),
+    (r".*marshmello.*", "Marshmello"),
+    (r".*dualipa.*", "Dua Lipa"),
 
     # International
     (r".*travis\s*scott.*", "Travis Scott"),
     (r".*bruno\s*mars.*", "Bruno Mars"),
     (r".*drake.*", "Drake"),
     (r".*2pac.*|.*tupac.*", "2Pac"),
-    (r".*the\s*weeknd.*", "The Weeknd"),
-	(r".*post\s*malone.*", "Post Malone"),
-	(r".*ariana\s*grande.*", "Ariana Grande"),
-	(r".*taylor\s*swift.*", "Taylor Swift"),
-	(r".*ed\s*sheeran.*", "Ed Sheeran"),
-	(r".*billie\s*eilish.*", "Billie Eilish"),
-	(r".*doja\s*cat.*", "Doja Cat"),
-	(r".*david\s*guetta.*", "David Guetta"),
-	(r".*calvin\s*harris.*", "Calvin Harris"),
-	(r".*martin\s*garrix.*", "Martin Garrix"),
-	(r".*tiesto.*", "Tiësto"),
-	(r".*marshmello.*", "Marshmello"),
-	(r".*dualipa.*", "Dua Lipa"),
 ]
 
+ARTIST_RULES: List[Tuple[str, str]] = (
+    [SPLIT_RULE] + REMOVAL_RULES + COLLABORATION_RULES + GENERAL_RULES + ARTIST_SPECIFIC_RULES
+)
+
 COMPILED_RULES = [(re.compile(pattern, re.IGNORECASE), replacement)
                  for pattern, replacement in ARTIST_RULES]
 
+# Übersetzungstabelle, die alle nicht-druckbaren ASCII-Zeichen löscht
+_PRINTABLE_CODES = frozenset(map(ord, string.printable))
+NONPRINTABLE_TABLE = {code: None for code in range(128) if code not in _PRINTABLE_CODES}
+
+def _build_cleanup_pattern(rules):
+    """
+    Fasst Bereinigungsregeln zu einer Alternation mit benannten Gruppen zusammen.
+
+    Returns:
+        Tuple aus dem kompilierten Pattern und einer Callback-Funktion für sub(),
+        die anhand von match.lastgroup die Ersetzung der jeweiligen Regel liefert.
+    """
+    replacements = {}
+    alternatives = []
+    for index, (pattern, replacement) in enumerate(rules):
+        group = f"r{index}"
+        replacements[group] = replacement
+        alternatives.append(f"(?P<{group}>{pattern})")
+    combined = re.compile("|".join(alternatives), re.IGNORECASE)
+    return combined, lambda match: replacements[match.lastgroup]
+
+SPLIT_PATTERN = re.compile(SPLIT_RULE[0], re.IGNORECASE)
+
+# Jeder weitere Abschnitt läuft in einem einzigen Durchlauf. Die YouTube-Zusätze
+# aus RAW_OVERRIDES werden zusammen mit den Entfernungsregeln gelöscht. Die
+# Kollaborationsregeln laufen danach, damit "+"/"&" die Leerzeichen entfernter
+# Teile mit aufnehmen.
+REMOVAL_PATTERN, _replace_removal = _build_cleanup_pattern(
+    [(NOISE_PATTERN.pattern, "")] + REMOVAL_RULES
+)
+COLLABORATION_PATTERN, _replace_collaboration = _build_cleanup_pattern(COLLABORATION_RULES)
+GENERAL_PATTERN, _replace_general = _build_cleanup_pattern(GENERAL_RULES)
+
+# Standardisierte Künstlernamen: Ziele der künstlerspezifischen Regeln sowie
+# Überschreibungen, die ihre eigene Schreibweise normalisieren (z.B. "drake" → "Drake").
+# Feature-Kürzel wie "ft" → "ft." zählen nicht dazu.
+CANONICAL_ARTISTS: Dict[str, str] = {
+    **{v.lower(): v for k, v in RAW_OVERRIDES.items() if v and k.lower() == v.lower()},
+    **{replacement.lower(): replacement for _, replacement in ARTIST_SPECIFIC_RULES},
+}
+
+MAPPING_RULES = [(re.compile(pattern, re.IGNORECASE), replacement)
+                 for pattern, replacement in ARTIST_SPECIFIC_RULES]
+
+# ".*<literal>.*" ohne Regex-Sonderzeichen prüft nur, ob das Literal enthalten ist
+LITERAL_CATCH_ALL_PATTERN = re.compile(r"^\.\*([^\\.^$*+?{}\[\]|()]+)\.\*$")
+
+def _catch_all_literal(pattern: "re.Pattern") -> Optional[str]:
+    """Liefert das kleingeschriebene Literal einer ".*<literal>.*"-Regel oder None."""
+    match = LITERAL_CATCH_ALL_PATTERN.match(pattern.pattern)
+    return match.group(1).lower() if match else None
+
+# (Literal oder None, Pattern, Ersetzung) je Zuordnungsregel, in Regel-Reihenfolge.
+# Für Literale genügt ein Teilstring-Test auf dem kleingeschriebenen Namen.
+MAPPING_CHECKS: List[Tuple[Optional[str], "re.Pattern", str]] = [
+    (_catch_all_literal(pattern), pattern, replacement) for pattern, replacement in MAPPING_RULES
+]
+
+def _build_mapping_automaton():
+    """
+    Baut einen Aho-Corasick-Automaten über die literalen Künstlerregeln.
+
+    Gespeichert wird (Regel-Index, Ersetzung), damit bei mehreren Treffern
+    die früheste Regel gewinnt. Regeln wie ".*bonez\\s*mc.*" bleiben Regex.
+    """
+    automaton = ahocorasick.Automaton()
+    regex_rules = []
+    for index, (literal, pattern, replacement) in enumerate(MAPPING_CHECKS):
+        if literal is None:
+            regex_rules.append((index, pattern, replacement))
+        elif literal not in automaton:
+            automaton.add_word(literal, (index, replacement))
+    automaton.make_automaton()
+    return automaton, regex_rules
+
+if HAS_AHOCORASICK:
+    MAPPING_AUTOMATON, REGEX_MAPPING_RULES = _build_mapping_automaton()
+
+def _find_mapping(name: str) -> Optional[str]:
+    """Liefert den Künstlernamen der ersten passenden Regel oder None."""
+    if not HAS_AHOCORASICK:
+        lower_name = name.lower()
+        for literal, pattern, replacement in MAPPING_CHECKS:
+            if literal is not None:
+                if literal in lower_name:
+                    return replacement
+            elif pattern.search(name):
+                return replacement
+        return None
+
+    best_index, best = len(MAPPING_RULES), None
+    for _, (index, replacement) in MAPPING_AUTOMATON.iter(name.lower()):
+        if index < best_index:
+            best_index, best = index, replacement
+    for index, pattern, replacement in REGEX_MAPPING_RULES:
+        if index >= best_index:
+            break
+        if pattern.search(name):
+            return replacement
+    return best
+
+# Reine Funktion: wiederkehrende Eingaben kommen aus dem Cache
+@lru_cache(maxsize=8192)
 def clean_artist_name(name: str) -> str:
     """
     Bereinigt und normalisiert einen Künstlernamen aus YouTube-Daten.
@@ -215,42 +334,76 @@ def clean_artist_name(name: str) -> str:
         str: Bereinigter Name (z.B. "ARTIST, X")
     """
     original_name = name
-    logger.debug(f"Verarbeite YouTube-Künstlername: '{original_name}'")
+    logger.debug("Verarbeite YouTube-Künstlername: '%s'", original_name)
+
+    # Bereits standardisierter Künstlername: keine Bereinigung nötig
+    canonical = CANONICAL_ARTISTS.get(name.strip().lower())
+    if canonical is not None:
+        return canonical
     
     # Nicht-druckbare Zeichen entfernen
-    printable = set(string.printable)
-    name = "".join(filter(lambda x: x in printable, name))
+    # (string.printable ist reines ASCII, Nicht-ASCII-Zeichen fallen also ebenfalls weg)
+    if not name.isascii():
+        name = name.encode("ascii", "ignore").decode("ascii")
+    name = name.translate(NONPRINTABLE_TABLE)
     
-    # Allgemeine YouTube-Bereinigung
-    for pattern, replacement in COMPILED_RULES[:9]:
-        name = pattern.sub(replacement, name)
+    # Allgemeine YouTube-Bereinigung; die Split-Regel greift nur bei einem "-"
+    if "-" in name:
+        name = SPLIT_PATTERN.sub(SPLIT_RULE[1], name)
+    name = REMOVAL_PATTERN.sub(_replace_removal, name)
+
+    # Kollaborations-Trennzeichen und allgemeine Bereinigungen
+    name = COLLABORATION_PATTERN.sub(_replace_collaboration, name)
+    name = GENERAL_PATTERN.sub(_replace_general, name)
+    # Leerzeichen, die erst die Bindestrich-Regel erzeugt, trimmt der Durchlauf
+    # selbst nicht mehr (z.B. "raf -" → "raf ")
+    name = " ".join(name.split())
+
+    # Bestand der Name nur aus Zusätzen (z.B. "VEVO", "(Official Video)"),
+    # bleibt der ursprüngliche Text erhalten statt eines leeren Namens
+    if not name:
+        logger.debug("Bereinigung ergab leeren Namen für: '%s'", original_name)
+        return original_name.strip()
     
     # Explizite Überschreibungen prüfen
-    lower_name = name.strip().lower()
+    lower_name = name.lower()
     if lower_name in ARTIST_OVERRIDES:
         result = ARTIST_OVERRIDES[lower_name]
-        if result == "":  # Falls leer (z.B. bei "official video")
-            result = name.strip()
         if original_name != result:
-            logger.info(f"Explizite Überschreibung (YouTube): '{original_name}' → '{result}'")
-        return result if result else name
+            logger.info("Explizite Überschreibung (YouTube): '%s' → '%s'", original_name, result)
+        return result
     
     # Künstlerspezifische Regeln anwenden
-    for pattern, replacement in COMPILED_RULES[9:]:
-        if pattern.search(name):
-            result = replacement
-            if original_name != result:
-                logger.info(f"Regex-Regel (YouTube): '{original_name}' → '{result}'")
-            return result
+    result = _find_mapping(name)
+    if result is not None:
+        if original_name != result:
+            logger.info("Regex-Regel (YouTube): '%s' → '%s'", original_name, result)
+        return result
     
-    # Fallback: Title-Case und endgültige Bereinigung
+    # Fallback: Title-Case. Die Bereinigungsregeln wurden oben bereits angewendet,
+    # und title() ändert nur die Groß-/Kleinschreibung (alle Regeln sind IGNORECASE).
     result = name.strip().title()
-    for pattern, replacement in COMPILED_RULES[9:]:  # Allgemeine Regeln erneut anwenden
-        result = pattern.sub(replacement, result)
     
     if result != original_name:
-        logger.info(f"Title-Case (YouTube): '{original_name}' → '{result}'")
+        logger.info("Title-Case (YouTube): '%s' → '%s'", original_name, result)
     else:
-        logger.debug(f"Keine Transformation für: '{original_name}'")
+        logger.debug("Keine Transformation für: '%s'", original_name)
     
-    return result
\ No newline at end of file
+    return result
+
+def clean_artist_names(names: Iterable[str]) -> List[str]:
+    """
+    Bereinigt viele Künstlernamen auf einmal (z.B. beim Scannen einer Bibliothek).
+
+    Liefert dieselben Ergebnisse wie clean_artist_name in Eingabereihenfolge;
+    jeder unterschiedliche Name wird dabei nur einmal verarbeitet.
+    """
+    results: Dict[str, str] = {}
+    cleaned = []
+    append = cleaned.append
+    for name in names:
+        result = results.get(name)
+        if result is None:
+            result = results[name] = clean_artist_name(name)
+        append(result)
+    return cleaned
@@ -9,18 +9,22 @@ Dieses Skript enthält:
 """
 
 import re
+import sys
 import logging
-from typing import Dict, List, Tuple
-
-# Logging-Konfiguration
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler()
-    ]
-)
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+# Optional: Aho-Corasick-Automat für die Teilstring-Zuordnungsregeln
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# Das Logging konfiguriert die Anwendung; ohne Konfiguration bleibt das Modul still
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 # ---------- 1. EXPLIZITE GENRE-ÜBERSCHREIBUNGEN ----------
 # Hier können spezifische, oft falsch geschriebene oder abweichende Genre-Namen
@@ -96,15 +100,21 @@ RAW_OVERRIDES: Dict[str, str] = {
     "sound effects": "Soundeffekte", # Nicht unbedingt ein Musikgenre, aber nützlich
 }
 
-GENRE_OVERRIDES: Dict[str, str] = {k.lower(): v for k, v in RAW_OVERRIDES.items()}
+# Schreibgeschützte Sicht, Schlüssel werden einmalig beim Import internalisiert
+GENRE_OVERRIDES: Mapping[str, str] = MappingProxyType(
+    {sys.intern(k.lower()): v for k, v in RAW_OVERRIDES.items()}
+)
+
+# Bereits standardisierte Genres (z.B. "Pop", "Drum & Bass") werden unverändert übernommen
+CANONICAL_GENRES: Dict[str, str] = {v.lower(): v for v in set(RAW_OVERRIDES.values())}
 
 # ---------- 2. REGEX-REGELN ZUR GENRE-BEREINIGUNG UND ZUORDNUNG ----------
 # Diese Regeln werden angewendet, um unerwünschte Zusätze zu entfernen
 # und Sub-Genres oder ähnliche Begriffe einem Haupt-Genre zuzuordnen.
 # Die Reihenfolge ist wichtig: Allgemeine Bereinigungen zuerst, dann spezifische Zuordnungen.
 
-GENRE_RULES: List[Tuple[str, str]] = [
-    # 1. Allgemeine Bereinigungen (entfernen von Zusatzinformationen)
+# 1. Allgemeine Bereinigungen (entfernen von Zusatzinformationen)
+GENRE_CLEANUP_RULES: List[Tuple[str, str]] = [
     # Entfernt alles in Klammern oder eckigen Klammern, das typische Genre-Zusätze enthält.
     # Z.B. "(Mix)", "[Live]", "(Radio Edit)"
     (r"\s*(\(|\[)(mix|remix|edit|version|live|radio|official|instrumental|acoustic|cover|bootleg|mashup|playlist|compilation|hits|best of|vol\.\s*\d+|part\s*\d+|chapter\s*\d+)\b[^)]*?(\)|\])", ""),
@@ -119,10 +129,12 @@ GENRE_RULES: List[Tuple[str, str]] = [
     (r",+", ","),
     (r"\s+", " "),
     (r"^\s+|\s+$", ""), # Trimmt führende/abschließende Leerzeichen
+]
 
-    # 2. Spezifische Genre-Zuordnungen (von spezifisch zu allgemeiner)
-    # Diese Regeln überschreiben nicht, sondern ordnen zu, wenn das Muster gefunden wird.
-    # Die Reihenfolge ist wichtig: spezifischere Matches sollten vor allgemeineren stehen.
+# 2. Spezifische Genre-Zuordnungen (von spezifisch zu allgemeiner)
+# Diese Regeln überschreiben nicht, sondern ordnen zu, wenn das Muster gefunden wird.
+# Die Reihenfolge ist wichtig: spezifischere Matches sollten vor allgemeineren stehen.
+GENRE_MAPPING_RULES: List[Tuple[str, str]] = [
     (r".*drum\s*&?\s*bass.*", "Drum & Bass"),
     (r".*dnb.*", "Drum & Bass"),
     (r".*dubstep.*", "Electronic"),
@@ -181,11 +193,97 @@ GENRE_RULES: List[Tuple[str, str]] = [
     (r".*sound\s*effects.*", "Soundeffekte"),
 ]
 
+GENRE_RULES: List[Tuple[str, str]] = GENRE_CLEANUP_RULES + GENRE_MAPPING_RULES
+
 # Vorcompilierte Regex-Patterns für bessere Performance
 # re.IGNORECASE wird verwendet, um Groß- und Kleinschreibung zu ignorieren.
 COMPILED_RULES = [(re.compile(pattern, re.IGNORECASE), replacement) 
                  for pattern, replacement in GENRE_RULES]
 
+CLEANUP_RULES = COMPILED_RULES[:len(GENRE_CLEANUP_RULES)]
+MAPPING_RULES = COMPILED_RULES[len(GENRE_CLEANUP_RULES):]
+
+# Aufteilung der Bereinigungsregeln nach ihrer Anwendung in clean_genre_name:
+# Zusätze in Klammern entfernen und Trennzeichen durch Komma ersetzen überschneiden
+# sich nicht und laufen in einem Durchlauf; Mehrfach-Leerzeichen und Trimmen
+# erledigt split()/join(); alles dazwischen läuft der Reihe nach.
+(_TAG_RULE, _SEPARATOR_RULE, *SEQUENTIAL_CLEANUP_RULES,
+ _COLLAPSE_SPACES_RULE, _TRIM_RULE) = CLEANUP_RULES
+
+TAG_OR_SEPARATOR_PATTERN = re.compile(
+    f"(?P<tag>{_TAG_RULE[0].pattern})|(?P<separator>{_SEPARATOR_RULE[0].pattern})",
+    re.IGNORECASE
+)
+
+# Ohne Klammer oder Trennzeichen kann keine der beiden Regeln greifen
+TAG_OR_SEPARATOR_CHARS = frozenset("([/|&")
+
+def _replace_tag_or_separator(match: "re.Match") -> str:
+    return _TAG_RULE[1] if match.lastgroup == "tag" else _SEPARATOR_RULE[1]
+
+# ".*<literal>.*" ohne Regex-Sonderzeichen ist eine reine Teilstring-Prüfung
+LITERAL_CATCH_ALL_PATTERN = re.compile(r"^\.\*([^\\.^$*+?{}\[\]|()]+)\.\*$")
+
+def _catch_all_literal(pattern: "re.Pattern") -> Optional[str]:
+    """Liefert das kleingeschriebene Literal einer ".*<literal>.*"-Regel oder None."""
+    match = LITERAL_CATCH_ALL_PATTERN.match(pattern.pattern)
+    return match.group(1).lower() if match else None
+
+# (Literal oder None, Pattern, Ersetzung) je Zuordnungsregel, in Regel-Reihenfolge.
+# Für Literale genügt ein Teilstring-Test auf dem kleingeschriebenen Namen.
+MAPPING_CHECKS: List[Tuple[Optional[str], "re.Pattern", str]] = [
+    (_catch_all_literal(pattern), pattern, replacement) for pattern, replacement in MAPPING_RULES
+]
+
+def _build_mapping_automaton():
+    """
+    Baut einen Aho-Corasick-Automaten über alle literalen Zuordnungsregeln.
+
+    Jedes Literal wird mit (Regel-Index, Ersetzung) abgelegt,
+    damit bei mehreren Treffern weiterhin die erste Regel in GENRE_RULES gewinnt.
+    Regeln mit echten Regex-Anteilen (z.B. "\\s*") bleiben in REGEX_MAPPING_RULES.
+    """
+    automaton = ahocorasick.Automaton()
+    regex_rules = []
+    for index, (literal, pattern, replacement) in enumerate(MAPPING_CHECKS):
+        if literal is None:
+            regex_rules.append((index, pattern, replacement))
+        elif literal not in automaton:
+            automaton.add_word(literal, (index, replacement))
+    automaton.make_automaton()
+    return automaton, regex_rules
+
+if HAS_AHOCORASICK:
+    MAPPING_AUTOMATON, REGEX_MAPPING_RULES = _build_mapping_automaton()
+
+def _find_mapping(name: str) -> Optional[str]:
+    """Liefert die Ersetzung der ersten passenden Zuordnungsregel oder None."""
+    if not HAS_AHOCORASICK:
+        lower_name = name.lower()
+        for literal, pattern, replacement in MAPPING_CHECKS:
+            if literal is not None:
+                if literal in lower_name:
+                    return replacement
+            elif pattern.search(name):
+                return replacement
+        return None
+
+    # Ein Durchlauf über den Namen liefert alle literalen Treffer; die Regel mit
+    # dem kleinsten Index entspricht dem ersten Treffer der linearen Suche.
+    best_index, best = len(MAPPING_RULES), None
+    for _, (index, replacement) in MAPPING_AUTOMATON.iter(name.lower()):
+        if index < best_index:
+            best_index, best = index, replacement
+    # Regex-Regeln müssen nur geprüft werden, wenn sie vor dem besten Treffer stehen
+    for index, pattern, replacement in REGEX_MAPPING_RULES:
+        if index >= best_index:
+            break
+        if pattern.search(name):
+            return replacement
+    return best
+
+# Reine Funktion: wiederkehrende Eingaben kommen aus dem Cache
+@lru_cache(maxsize=8192)
 def clean_genre_name(name: str) -> str:
     """
     Bereinigt und normalisiert einen Genre-Namen anhand definierter Regeln.
@@ -199,6 +297,7 @@ def clean_genre_name(name: str) -> str:
     Verarbeitungsschritte:
         1. Entfernen von Leerzeichen am Anfang/Ende und Umwandlung in Kleinbuchstaben
         2. Prüfung auf explizite Überschreibungen (höchste Priorität)
+           und auf bereits standardisierte Genre-Namen
         3. Anwendung der Regex-Bereinigungsregeln (mehrere können angewendet werden)
         4. Anwendung der Regex-Zuordnungsregeln (die erste passende wird angewendet)
         5. Falls keine Regel zutrifft: Title-Case als Fallback oder ein Standard-Genre.
@@ -207,39 +306,45 @@ def clean_genre_name(name: str) -> str:
     name = name.strip()
     lower_name = name.lower()
     
-    logger.debug(f"Verarbeite Genre-Name: '{original_name}'")
+    logger.debug("Verarbeite Genre-Name: '%s'", original_name)
     
     # 1. Prüfe explizite Überschreibungen (höchste Priorität)
     if lower_name in GENRE_OVERRIDES:
         result = GENRE_OVERRIDES[lower_name]
-        logger.info(f"Explizite Überschreibung: '{original_name}' → '{result}'")
+        logger.info("Explizite Überschreibung: '%s' → '%s'", original_name, result)
         return result
+
+    # Bereits standardisierter Genre-Name: keine Regex-Regeln nötig
+    if lower_name in CANONICAL_GENRES:
+        return CANONICAL_GENRES[lower_name]
     
     # Temporäre Variable für die Bereinigung, da mehrere Bereinigungsregeln greifen können
     cleaned_name = name 
     
-    # 2. Wende Regex-Regeln an
-    for pattern, replacement in COMPILED_RULES:
-        # Prüfe, ob es eine Bereinigungsregel ist (replacement ist leer)
-        # oder eine spezifische Genre-Zuordnungsregel.
-        if pattern.search(cleaned_name):
-            if replacement == "": # Dies ist eine Bereinigungsregel
-                # Wende die Bereinigung an und fahre mit dem bereinigten Namen fort
-                cleaned_name = pattern.sub(replacement, cleaned_name).strip()
-                logger.debug(f"Bereinigungsregel angewendet: '{original_name}' (aktuell: '{cleaned_name}') durch Pattern '{pattern.pattern}'")
-            else: # Dies ist eine spezifische Genre-Zuordnungsregel
-                # Die erste passende Zuordnungsregel wird angewendet und zurückgegeben
-                result = replacement
-                logger.info(f"Spezifische Genre-Regel angewendet: '{original_name}' → '{result}' (Pattern: {pattern.pattern})")
-                return result
+    # 2. Wende alle Regex-Bereinigungsregeln nacheinander an. Auch Regeln mit
+    # nicht-leerer Ersetzung (z.B. Trennzeichen → ", ") sind Bereinigungen und
+    # dürfen nicht als Zuordnung zurückgegeben werden.
+    if not TAG_OR_SEPARATOR_CHARS.isdisjoint(cleaned_name):
+        cleaned_name = TAG_OR_SEPARATOR_PATTERN.sub(_replace_tag_or_separator, cleaned_name)
+    for pattern, replacement in SEQUENTIAL_CLEANUP_RULES:
+        cleaned_name = pattern.sub(replacement, cleaned_name)
+    # Die letzten beiden Regeln (Mehrfach-Leerzeichen, Trimmen) ohne Regex
+    cleaned_name = " ".join(cleaned_name.split())
+    logger.debug("Bereinigung angewendet: '%s' (aktuell: '%s')", original_name, cleaned_name)
+
+    # 3. Wende die Zuordnungsregeln an (die erste passende gewinnt)
+    result = _find_mapping(cleaned_name)
+    if result is not None:
+        logger.info("Spezifische Genre-Regel angewendet: '%s' → '%s'", original_name, result)
+        return result
     
-    # 3. Fallback: Wenn keine Regel zutrifft, verwende den (bereinigten) Namen im Title-Case.
+    # 4. Fallback: Wenn keine Regel zutrifft, verwende den (bereinigten) Namen im Title-Case.
     # Wenn der bereinigte Name leer ist, setze auf "Unbekannt".
     result = cleaned_name.title() if cleaned_name else "Unbekannt"
     
     if result != original_name:
-        logger.info(f"Fallback/Title-Case angewendet: '{original_name}' → '{result}'")
+        logger.info("Fallback/Title-Case angewendet: '%s' → '%s'", original_name, result)
     else:
-        logger.debug(f"Keine Transformationen angewendet auf: '{original_name}'")
+        logger.debug("Keine Transformationen angewendet auf: '%s'", original_name)
     
     return result
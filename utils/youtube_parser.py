@@ -9,19 +9,52 @@ typischen Zusätzen wie "(Official Video)" zu bereinigen.
 
 import re
 import logging
-from typing import Dict
-
-# Logging-Konfiguration, falls du detaillierte Ausgaben wünschst
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler()
-    ]
-)
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Tuple
+
+# Das Logging konfiguriert die Anwendung; ohne Konfiguration bleibt das Modul still
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Ein einziger Durchlauf entfernt Klammer-Zusätze ((...) und [...]) sowie alles
+# ab dem ersten senkrechten Strich.
+_CLEANUP_PATTERN = re.compile(r'\s*[\[(].*?[\])]|\s*\|(?s:.*)')
+
+class ParseResult(NamedTuple):
+    """Ergebnis von parse_youtube_title."""
+    artist: str
+    song_title: str
+    original_title: str
+
+_EMPTY_RESULT = ParseResult('', '', '')
+
+def _split_title(title: str) -> Tuple[str, str]:
+    """Bereinigt einen nicht-leeren Titel und trennt ihn in (Künstler, Songtitel)."""
+    # 1. Entferne typische Zusätze in Klammern und eckigen Klammern
+    # Dies entfernt z.B. (Official Video), [4K], (Lyrics), | prod. by ...
+    # Der Regex sucht nach Klammern/eckigen Klammern und allem dazwischen.
+    # Auch Zusätze nach einem senkrechten Strich werden entfernt.
+    # Stehen vor dem ersten senkrechten Strich keine Klammern, genügt es, dort
+    # abzuschneiden (ohne Strich ist das der ganze Titel) -> kein Regex nötig.
+    head = title.partition('|')[0]
+    if '(' in head or '[' in head:
+        cleaned_title = _CLEANUP_PATTERN.sub('', title).strip()
+    else:
+        cleaned_title = head.strip()
+
+    # 2. Versuche, Künstler und Song anhand des Trennzeichens "-" zu trennen
+    head, separator, tail = cleaned_title.partition('-')
+    if separator:
+        return head.strip(), tail.strip()
 
-def parse_youtube_title(title: str) -> Dict[str, str]:
+    # Wenn kein Trennzeichen gefunden wurde, nehmen wir an, der ganze
+    # bereinigte String ist der Songtitel. Der Künstler müsste dann
+    # aus einer anderen Quelle kommen (z.B. Kanalname).
+    return "", cleaned_title
+
+# Reine Funktion: wiederkehrende Eingaben kommen aus dem Cache
+@lru_cache(maxsize=8192)
+def parse_youtube_title(title: str) -> ParseResult:
     """
     Zerlegt einen YouTube-Titel in Künstler, Songtitel und entfernt gängige Zusätze.
 
@@ -32,46 +65,46 @@ def parse_youtube_title(title: str) -> Dict[str, str]:
         title (str): Der rohe YouTube-Titel, z.B. "Künstler - Song (Official Video)".
 
     Returns:
-        Dict[str, str]: Ein Dictionary mit den Schlüsseln 'artist', 'song_title'
-                        und 'original_title'. 'artist' kann leer sein, wenn keine
-                        klare Trennung möglich war.
+        ParseResult: Ein NamedTuple mit den Feldern 'artist', 'song_title'
+                     und 'original_title'. 'artist' kann leer sein, wenn keine
+                     klare Trennung möglich war.
     """
     if not title:
-        return {'artist': '', 'song_title': '', 'original_title': ''}
+        return _EMPTY_RESULT
+
+    # Schneller Pfad: weder Trennzeichen noch Zusätze -> der ganze Titel ist der Songtitel.
+    if '-' not in title and '|' not in title and '(' not in title and '[' not in title:
+        return ParseResult('', title.strip(), title)
 
     original_title = title
-    logger.debug(f"Verarbeite Titel: '{original_title}'")
+    logger.debug("Verarbeite Titel: '%s'", original_title)
 
-    # 1. Entferne typische Zusätze in Klammern und eckigen Klammern
-    # Dies entfernt z.B. (Official Video), [4K], (Lyrics), | prod. by ...
-    # Der Regex sucht nach Klammern/eckigen Klammern und allem dazwischen.
-    # Auch Zusätze nach einem senkrechten Strich werden entfernt.
-    cleaned_title = re.sub(r'\s*(\[|\().*?(\]|\))', '', title)
-    cleaned_title = cleaned_title.split('|')[0].strip()
-    
-    # 2. Versuche, Künstler und Song anhand des Trennzeichens "-" zu trennen
-    parts = cleaned_title.split('-', 1)
-    
-    artist = ""
-    song_title = ""
-
-    if len(parts) == 2:
-        # Wenn eine Trennung erfolgreich war
-        artist = parts[0].strip()
-        song_title = parts[1].strip()
-        logger.info(f"Titel '{original_title}' getrennt in Künstler '{artist}' und Song '{song_title}'")
+    artist, song_title = _split_title(title)
+
+    if artist:
+        logger.info("Titel '%s' getrennt in Künstler '%s' und Song '%s'", original_title, artist, song_title)
     else:
-        # Wenn kein Trennzeichen gefunden wurde, nehmen wir an, der ganze
-        # bereinigte String ist der Songtitel. Der Künstler müsste dann
-        # aus einer anderen Quelle kommen (z.B. Kanalname).
-        song_title = cleaned_title
-        logger.info(f"Kein Trennzeichen in '{original_title}' gefunden. Songtitel ist '{song_title}'")
-
-    return {
-        'artist': artist,
-        'song_title': song_title,
-        'original_title': original_title
-    }
+        logger.info("Kein Trennzeichen in '%s' gefunden. Songtitel ist '%s'", original_title, song_title)
+
+    return ParseResult(artist, song_title, original_title)
+
+def parse_many(titles: Iterable[str]) -> List[ParseResult]:
+    """
+    Zerlegt viele YouTube-Titel auf einmal (z.B. für Playlist-Scans).
+
+    Liefert dieselben Ergebnisse wie parse_youtube_title, verzichtet aber auf
+    das Logging pro Titel.
+    """
+    results = []
+    append = results.append
+    split = _split_title
+    for title in titles:
+        if not title:
+            append(_EMPTY_RESULT)
+            continue
+        artist, song_title = split(title)
+        append(ParseResult(artist, song_title, title))
+    return results
 
 # --- Beispiel für die Anwendung ---
 if __name__ == "__main__":
@@ -91,7 +124,7 @@ if __name__ == "__main__":
     for i, test_title in enumerate(test_titles):
         parsed_data = parse_youtube_title(test_title)
         print(f"\n--- Testfall {i+1} ---")
-        print(f"Original:     {parsed_data['original_title']}")
-        print(f"Erk. Künstler: '{parsed_data['artist']}'")
-        print(f"Erk. Song:    '{parsed_data['song_title']}'")
+        print(f"Original:     {parsed_data.original_title}")
+        print(f"Erk. Künstler: '{parsed_data.artist}'")
+        print(f"Erk. Song:    '{parsed_data.song_title}'")
 